@@ -26,6 +26,7 @@ from typing import Any, Optional
 import fiona
 import geopandas as gpd
 import pandas as pd
+import pyogrio
 
 from .exceptions import AcquisitionError, InvalidResponseError
 from .models import BoundingBox, TargetArea
@@ -431,12 +432,15 @@ class AdamsCountyFileLoader:
     def load_property_values(
         self,
         standardize_fields: bool = True,
+        columns: Optional[list[str]] = None,
     ) -> pd.DataFrame:
         """
         Load property values data (no geometry).
 
         Args:
             standardize_fields: If True, rename fields to standard names.
+            columns: Optional source field names to read; all fields if None.
+                Fields missing from the layer are ignored.
 
         Returns:
             DataFrame with property valuation data.
@@ -446,13 +450,14 @@ class AdamsCountyFileLoader:
         logger.info("Loading property values from %s", self.parcels_gdb_path)
 
         try:
-            # Use fiona to read non-spatial table
-            with fiona.open(
-                str(self.parcels_gdb_path), layer=GDB_LAYERS["values"]
-            ) as src:
-                records = [record["properties"] for record in src]
-
-            df = pd.DataFrame(records)
+            # Read the non-spatial table straight into a DataFrame, letting
+            # the driver skip unrequested fields
+            df = pyogrio.read_dataframe(
+                str(self.parcels_gdb_path),
+                layer=GDB_LAYERS["values"],
+                columns=columns,
+                read_geometry=False,
+            )
             logger.info("Loaded %d property value records", len(df))
 
             if standardize_fields:
@@ -470,12 +475,15 @@ class AdamsCountyFileLoader:
     def load_property_improvements(
         self,
         standardize_fields: bool = True,
+        columns: Optional[list[str]] = None,
     ) -> pd.DataFrame:
         """
         Load property improvements data (buildings on parcels).
 
         Args:
             standardize_fields: If True, rename fields to standard names.
+            columns: Optional source field names to read; all fields if None.
+                Fields missing from the layer are ignored.
 
         Returns:
             DataFrame with building/improvement data.
@@ -485,12 +493,12 @@ class AdamsCountyFileLoader:
         logger.info("Loading property improvements from %s", self.parcels_gdb_path)
 
         try:
-            with fiona.open(
-                str(self.parcels_gdb_path), layer=GDB_LAYERS["improvements"]
-            ) as src:
-                records = [record["properties"] for record in src]
-
-            df = pd.DataFrame(records)
+            df = pyogrio.read_dataframe(
+                str(self.parcels_gdb_path),
+                layer=GDB_LAYERS["improvements"],
+                columns=columns,
+                read_geometry=False,
+            )
             logger.info("Loaded %d improvement records", len(df))
 
             if standardize_fields:
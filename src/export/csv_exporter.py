@@ -13,6 +13,9 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Rows formatted and written per batch by DataFrame.to_csv
+CSV_CHUNK_SIZE = 50_000
+
 
 class CSVExporter:
     """Export property data to CSV format for CRM import."""
@@ -33,6 +36,7 @@ class CSVExporter:
         filename: str = "denver_ios_crm.csv",
         include_all: bool = True,
         min_grade: Optional[str] = None,
+        compress: bool = False,
     ) -> Path:
         """
         Export scored properties to a CSV file for CRM import.
@@ -42,14 +46,18 @@ class CSVExporter:
             filename: Output filename
             include_all: If True, include all properties; if False, use min_grade filter
             min_grade: Minimum grade to include (A, B, C, D, or F)
+            compress: If True, gzip the output (".gz" is appended to filename if missing)
 
         Returns:
             Path to the generated CSV file
         """
+        if compress and not filename.endswith(".gz"):
+            filename += ".gz"
         output_path = self.output_dir / filename
         logger.info(f"Generating CRM CSV: {output_path}")
 
-        df = scored_df.copy()
+        # Read-only below, so no defensive copy is needed
+        df = scored_df
 
         # Filter by grade if specified
         if not include_all and min_grade:
@@ -68,8 +76,8 @@ class CSVExporter:
         if "ios_score" in crm_df.columns:
             crm_df = crm_df.sort_values("ios_score", ascending=False)
 
-        # Save to CSV
-        crm_df.to_csv(output_path, index=False)
+        # Save to CSV in row batches (gzip is inferred from a .gz filename)
+        crm_df.to_csv(output_path, index=False, chunksize=CSV_CHUNK_SIZE, compression="infer")
         logger.info(f"CRM CSV saved: {output_path} ({len(crm_df)} records, {len(crm_df.columns)} columns)")
 
         return output_path
@@ -184,8 +192,13 @@ class CSVExporter:
         if "parcel_sqft" in result_data and "acres" not in result_data:
             result_data["acres"] = result_data["parcel_sqft"] / 43560.0
 
-        # Add latitude/longitude from geometry centroids
-        if "geometry" in df.columns:
+        # Add latitude/longitude from the integrator's cached centroids, or
+        # from geometry centroids
+        if "centroid_lat" in df.columns and "centroid_lon" in df.columns:
+            result_data["latitude"] = df["centroid_lat"]
+            result_data["longitude"] = df["centroid_lon"]
+            used_source_cols.update(("centroid_lat", "centroid_lon"))
+        elif "geometry" in df.columns:
             try:
                 centroids = df.geometry.centroid
                 result_data["latitude"] = centroids.y
@@ -250,6 +263,7 @@ def export_to_csv(
     output_dir: Path | str = "deliverables",
     filename: str = "denver_ios_crm.csv",
     min_grade: Optional[str] = None,
+    compress: bool = False,
 ) -> Path:
     """
     Convenience function to export scored properties to CSV.
@@ -259,10 +273,13 @@ def export_to_csv(
         output_dir: Output directory
         filename: Output filename
         min_grade: Minimum grade to include (None for all)
+        compress: Write a gzip-compressed .csv.gz file
 
     Returns:
         Path to generated CSV file
     """
     exporter = CSVExporter(output_dir)
     include_all = min_grade is None
-    return exporter.export(scored_df, filename, include_all=include_all, min_grade=min_grade)
+    return exporter.export(
+        scored_df, filename, include_all=include_all, min_grade=min_grade, compress=compress
+    )
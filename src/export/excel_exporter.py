@@ -10,9 +10,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.worksheet.worksheet import Worksheet
 
@@ -36,6 +39,132 @@ THIN_BORDER = Border(
     top=Side(style="thin"),
     bottom=Side(style="thin"),
 )
+HEADER_ALIGNMENT = Alignment(horizontal="center", wrap_text=True)
+SECTION_FONT = Font(bold=True, size=12)
+
+# Float cell formats as (decimal places, number format)
+PERCENT_FORMAT = (1, "0.0%")
+CURRENCY_FORMAT = (0, "$#,##0")
+DECIMAL_FORMAT = (2, None)
+
+CURRENCY_COLUMNS = frozenset({
+    "Total Assessed Value",
+    "Land Value",
+    "Price Per Acre",
+    "Actual Total Value",
+    "Actual Land Value",
+    "Actual Improvement Value",
+    "Assessed Total Value",
+    "Last Sale Price",
+})
+DECIMAL_COLUMNS = frozenset({"Acres", "IOS Score"})
+
+# Columns added by ExcelExporter._enrich (never shown under their raw names)
+COMPUTED_COLUMNS = ("_acres", "_open_space_pct", "_lat", "_lon", "_gmaps_url")
+
+# Centroids cached by PropertyDataIntegrator; shown as Lat/Lon, not passed through
+CENTROID_COLUMNS = ("centroid_lat", "centroid_lon")
+
+# Number of DataFrame rows materialized at a time when writing a sheet
+ROW_CHUNK_SIZE = 10_000
+
+
+METHODOLOGY_TEXT = """
+IOS (Industrial Outdoor Storage) SCORING METHODOLOGY
+
+OVERVIEW
+The IOS Score is a composite rating from 0-100 that evaluates each property's
+suitability for industrial outdoor storage use. Higher scores indicate better
+candidates for IOS investment or development.
+
+SCORING DIMENSIONS (Weighted Components)
+
+1. PARCEL SIZE (25% weight)
+   - Optimal: 2-5 acres (score: 100)
+   - Excellent: 5-10 acres (score: 95)
+   - Good: 1-2 acres (score: 70)
+   - Large workable: 10-20 acres (score: 70)
+   - Marginal: 0.5-1 acres (score: 30)
+   - Too small: <0.5 acres (score: 0)
+   - Very large: >20 acres (score: 40)
+
+2. BUILDING COVERAGE (30% weight) - INVERTED
+   Lower coverage = higher score (more open space for storage)
+   - Optimal: 5-15% coverage (score: 100)
+   - Mostly open: <5% (score: 95)
+   - Good: 15-25% (score: 85)
+   - Marginal: 25-35% (score: 60)
+   - Poor: 35-50% (score: 30)
+   - Not suitable: >50% (score: 0)
+
+3. ZONING (20% weight)
+   - Industrial (I-1, I-2, I-3): score 100
+   - Heavy Commercial (C-5): score 75
+   - Highway Commercial (C-4): score 65
+   - Agricultural (A-1, A-2, A-3): score 55
+   - PUD/Mixed Use: score 50
+   - Office/Community Commercial: score 40
+   - Residential: score 10
+
+4. LAND USE (15% weight)
+   Based on current use and property type descriptions.
+   - Outdoor storage, contractor yard: score 100
+   - Equipment/vehicle storage: score 90-95
+   - Industrial yard: score 90
+   - Vacant land: score 75
+   - Warehouse/distribution: score 55-60
+   - Commercial: score 40
+   - Residential: score 10
+
+5. STRUCTURAL (5% weight)
+   Based on building count and sizes.
+   - Vacant (no buildings): +20 bonus
+   - Single small building (<2,000 sqft): +30 total bonus
+   - Multiple or large buildings: penalties applied
+
+6. LOCATION (5% weight)
+   - Base score for target industrial area: 60
+   - DIA proximity bonus: +15
+
+GRADE CLASSIFICATION
+
+- Grade A (85-100): Excellent IOS Candidate
+  High priority - immediate follow-up recommended
+
+- Grade B (75-84): Good IOS Candidate
+  Strong potential - worth detailed analysis
+
+- Grade C (65-74): Moderate IOS Candidate
+  Possible opportunity - review for specific use cases
+
+- Grade D (50-64): Marginal IOS Candidate
+  Limited suitability - consider only if other factors favorable
+
+- Grade F (0-49): Poor IOS Candidate
+  Not recommended for IOS use
+
+DATA SOURCES
+
+- Parcel boundaries and ownership: Adams County Assessor
+- Building footprints: Adams County GIS
+- Zoning: Adams County Planning & Development
+- Sales history: Adams County Assessor (when available)
+
+NOTES
+
+- Scores are relative rankings, not absolute valuations
+- Manual verification recommended for top candidates
+- Zoning changes or variances may affect actual suitability
+- Building coverage calculated from GIS building footprints
+
+Generated by Denver IOS Property Sourcing System
+"""
+
+# Methodology sheet lines with a header flag, split once at import time
+METHODOLOGY_LINES = [
+    (line, line.isupper() and bool(line.strip()))
+    for line in METHODOLOGY_TEXT.strip().split("\n")
+]
 
 
 class ExcelExporter:
@@ -56,6 +185,7 @@ class ExcelExporter:
         scored_df: pd.DataFrame,
         filename: str = "denver_ios_analysis.xlsx",
         filter_criteria: Optional[dict[str, Any]] = None,
+        streaming: bool = False,
     ) -> Path:
         """
         Export scored properties to a multi-sheet Excel workbook.
@@ -64,6 +194,8 @@ class ExcelExporter:
             scored_df: DataFrame with IOS scores and property data
             filename: Output filename
             filter_criteria: Dictionary of filter criteria used (for documentation)
+            streaming: If True, use an openpyxl write-only workbook so rows are
+                flushed to disk as they are appended instead of held in memory
 
         Returns:
             Path to the generated Excel file
@@ -71,11 +203,13 @@ class ExcelExporter:
         output_path = self.output_dir / filename
         logger.info(f"Generating Excel workbook: {output_path}")
 
-        # Create workbook
-        wb = Workbook()
+        # Compute derived columns once for all sheets
+        scored_df = self._enrich(scored_df)
 
-        # Remove default sheet
-        wb.remove(wb.active)
+        # Create workbook (write-only workbooks start without a default sheet)
+        wb = Workbook(write_only=streaming)
+        if not streaming:
+            wb.remove(wb.active)
 
         # Create sheets in order
         self._create_executive_summary(wb, scored_df, filter_criteria)
@@ -90,6 +224,47 @@ class ExcelExporter:
 
         return output_path
 
+    def _enrich(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add computed display columns once so each sheet can reuse them.
+
+        Adds acreage, open space percentage, centroid coordinates and
+        Google Maps links (see COMPUTED_COLUMNS) where the source data
+        allows. The input DataFrame is not modified.
+        """
+        computed = {}
+
+        parcel_sqft_col = self._find_column(df, "parcel_area_sqft")
+        if parcel_sqft_col:
+            computed["_acres"] = df[parcel_sqft_col] / 43560.0
+
+        coverage_col = self._find_column(df, "building_coverage_pct", "coverage_pct")
+        if coverage_col:
+            computed["_open_space_pct"] = 100 - df[coverage_col]
+
+        # Centroids are the expensive part - reuse the integrator's cached
+        # ones, or compute them a single time
+        lat = lon = None
+        if all(col in df.columns for col in CENTROID_COLUMNS):
+            lat, lon = df["centroid_lat"], df["centroid_lon"]
+        elif "geometry" in df.columns:
+            try:
+                centroids = df.geometry.centroid
+                lat, lon = centroids.y, centroids.x
+            except Exception:
+                pass
+
+        if lat is not None:
+            computed["_lat"] = lat
+            computed["_lon"] = lon
+            computed["_gmaps_url"] = np.where(
+                lat.notna() & lon.notna(),
+                "https://www.google.com/maps?q=" + lat.astype(str) + "," + lon.astype(str),
+                "",
+            )
+
+        return df.assign(**computed)
+
     def _create_executive_summary(
         self,
         wb: Workbook,
@@ -99,28 +274,27 @@ class ExcelExporter:
         """Create the Executive Summary sheet."""
         ws = wb.create_sheet("Executive Summary")
 
+        # Column widths must be set before rows are appended in write-only mode
+        ws.column_dimensions["A"].width = 35
+        ws.column_dimensions["B"].width = 20
+        ws.column_dimensions["C"].width = 15
+
         # Title
-        ws["A1"] = "Denver IOS Property Analysis - Executive Summary"
-        ws["A1"].font = Font(bold=True, size=16)
-        ws.merge_cells("A1:D1")
+        ws.append([self._cell(ws, "Denver IOS Property Analysis - Executive Summary", font=Font(bold=True, size=16))])
+        if not wb.write_only:
+            ws.merge_cells("A1:D1")
+        ws.append([])
 
-        ws["A3"] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        ws["A3"].font = Font(italic=True)
+        ws.append([self._cell(ws, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", font=Font(italic=True))])
+        ws.append([])
 
         # Overview section
-        row = 5
-        ws[f"A{row}"] = "ANALYSIS OVERVIEW"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-        row += 1
-
-        ws[f"A{row}"] = "Total Properties Analyzed:"
-        ws[f"B{row}"] = len(df)
-        row += 2
+        ws.append([self._cell(ws, "ANALYSIS OVERVIEW", font=SECTION_FONT)])
+        ws.append(["Total Properties Analyzed:", len(df)])
+        ws.append([])
 
         # Score distribution
-        ws[f"A{row}"] = "SCORE DISTRIBUTION"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-        row += 1
+        ws.append([self._cell(ws, "SCORE DISTRIBUTION", font=SECTION_FONT)])
 
         grade_col = self._find_column(df, "ios_grade", "grade")
         if grade_col:
@@ -128,69 +302,45 @@ class ExcelExporter:
             for grade in ["A", "B", "C", "D", "F"]:
                 count = grade_counts.get(grade, 0)
                 pct = (count / len(df) * 100) if len(df) > 0 else 0
-                ws[f"A{row}"] = f"Grade {grade}:"
-                ws[f"B{row}"] = count
-                ws[f"C{row}"] = f"{pct:.1f}%"
-                if grade in GRADE_COLORS:
-                    ws[f"A{row}"].fill = GRADE_COLORS[grade]
-                    ws[f"B{row}"].fill = GRADE_COLORS[grade]
-                    ws[f"C{row}"].fill = GRADE_COLORS[grade]
-                row += 1
+                fill = GRADE_COLORS.get(grade)
+                ws.append([
+                    self._cell(ws, f"Grade {grade}:", fill=fill),
+                    self._cell(ws, count, fill=fill),
+                    self._cell(ws, f"{pct:.1f}%", fill=fill),
+                ])
 
-        row += 1
+        ws.append([])
 
         # Property statistics
-        ws[f"A{row}"] = "PROPERTY STATISTICS"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-        row += 1
+        ws.append([self._cell(ws, "PROPERTY STATISTICS", font=SECTION_FONT)])
 
         # Acreage stats
         acres_col = self._find_column(df, "acres", "calc_acreage", "parcel_acres")
         if acres_col and acres_col in df.columns:
-            ws[f"A{row}"] = "Average Parcel Size (acres):"
-            ws[f"B{row}"] = round(df[acres_col].mean(), 2)
-            row += 1
-            ws[f"A{row}"] = "Total Acreage:"
-            ws[f"B{row}"] = round(df[acres_col].sum(), 2)
-            row += 1
+            ws.append(["Average Parcel Size (acres):", round(df[acres_col].mean(), 2)])
+            ws.append(["Total Acreage:", round(df[acres_col].sum(), 2)])
 
         # Building coverage stats
         coverage_col = self._find_column(df, "building_coverage_pct", "coverage_pct")
         if coverage_col and coverage_col in df.columns:
-            ws[f"A{row}"] = "Average Building Coverage:"
-            ws[f"B{row}"] = f"{df[coverage_col].mean():.1f}%"
-            row += 1
+            ws.append(["Average Building Coverage:", f"{df[coverage_col].mean():.1f}%"])
 
         # Score stats
         score_col = self._find_column(df, "ios_score", "score")
         if score_col and score_col in df.columns:
-            ws[f"A{row}"] = "Average IOS Score:"
-            ws[f"B{row}"] = round(df[score_col].mean(), 1)
-            row += 1
-            ws[f"A{row}"] = "Highest IOS Score:"
-            ws[f"B{row}"] = round(df[score_col].max(), 1)
-            row += 1
+            ws.append(["Average IOS Score:", round(df[score_col].mean(), 1)])
+            ws.append(["Highest IOS Score:", round(df[score_col].max(), 1)])
 
-        row += 1
+        ws.append([])
 
         # Filter criteria
-        ws[f"A{row}"] = "FILTER CRITERIA USED"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-        row += 1
+        ws.append([self._cell(ws, "FILTER CRITERIA USED", font=SECTION_FONT)])
 
         if filter_criteria:
             for key, value in filter_criteria.items():
-                ws[f"A{row}"] = f"{key}:"
-                ws[f"B{row}"] = str(value)
-                row += 1
+                ws.append([f"{key}:", str(value)])
         else:
-            ws[f"A{row}"] = "No filters applied (all properties included)"
-            row += 1
-
-        # Adjust column widths
-        ws.column_dimensions["A"].width = 35
-        ws.column_dimensions["B"].width = 20
-        ws.column_dimensions["C"].width = 15
+            ws.append(["No filters applied (all properties included)"])
 
     def _create_top_candidates(self, wb: Workbook, df: pd.DataFrame) -> None:
         """Create the Top Candidates sheet (A and B grade only)."""
@@ -276,106 +426,11 @@ class ExcelExporter:
     def _create_methodology(self, wb: Workbook) -> None:
         """Create the Methodology sheet with scoring explanation."""
         ws = wb.create_sheet("Methodology")
-
-        methodology_text = """
-IOS (Industrial Outdoor Storage) SCORING METHODOLOGY
-
-OVERVIEW
-The IOS Score is a composite rating from 0-100 that evaluates each property's
-suitability for industrial outdoor storage use. Higher scores indicate better
-candidates for IOS investment or development.
-
-SCORING DIMENSIONS (Weighted Components)
-
-1. PARCEL SIZE (25% weight)
-   - Optimal: 2-5 acres (score: 100)
-   - Excellent: 5-10 acres (score: 95)
-   - Good: 1-2 acres (score: 70)
-   - Large workable: 10-20 acres (score: 70)
-   - Marginal: 0.5-1 acres (score: 30)
-   - Too small: <0.5 acres (score: 0)
-   - Very large: >20 acres (score: 40)
-
-2. BUILDING COVERAGE (30% weight) - INVERTED
-   Lower coverage = higher score (more open space for storage)
-   - Optimal: 5-15% coverage (score: 100)
-   - Mostly open: <5% (score: 95)
-   - Good: 15-25% (score: 85)
-   - Marginal: 25-35% (score: 60)
-   - Poor: 35-50% (score: 30)
-   - Not suitable: >50% (score: 0)
-
-3. ZONING (20% weight)
-   - Industrial (I-1, I-2, I-3): score 100
-   - Heavy Commercial (C-5): score 75
-   - Highway Commercial (C-4): score 65
-   - Agricultural (A-1, A-2, A-3): score 55
-   - PUD/Mixed Use: score 50
-   - Office/Community Commercial: score 40
-   - Residential: score 10
-
-4. LAND USE (15% weight)
-   Based on current use and property type descriptions.
-   - Outdoor storage, contractor yard: score 100
-   - Equipment/vehicle storage: score 90-95
-   - Industrial yard: score 90
-   - Vacant land: score 75
-   - Warehouse/distribution: score 55-60
-   - Commercial: score 40
-   - Residential: score 10
-
-5. STRUCTURAL (5% weight)
-   Based on building count and sizes.
-   - Vacant (no buildings): +20 bonus
-   - Single small building (<2,000 sqft): +30 total bonus
-   - Multiple or large buildings: penalties applied
-
-6. LOCATION (5% weight)
-   - Base score for target industrial area: 60
-   - DIA proximity bonus: +15
-
-GRADE CLASSIFICATION
-
-- Grade A (85-100): Excellent IOS Candidate
-  High priority - immediate follow-up recommended
-
-- Grade B (75-84): Good IOS Candidate
-  Strong potential - worth detailed analysis
-
-- Grade C (65-74): Moderate IOS Candidate
-  Possible opportunity - review for specific use cases
-
-- Grade D (50-64): Marginal IOS Candidate
-  Limited suitability - consider only if other factors favorable
-
-- Grade F (0-49): Poor IOS Candidate
-  Not recommended for IOS use
-
-DATA SOURCES
-
-- Parcel boundaries and ownership: Adams County Assessor
-- Building footprints: Adams County GIS
-- Zoning: Adams County Planning & Development
-- Sales history: Adams County Assessor (when available)
-
-NOTES
-
-- Scores are relative rankings, not absolute valuations
-- Manual verification recommended for top candidates
-- Zoning changes or variances may affect actual suitability
-- Building coverage calculated from GIS building footprints
-
-Generated by Denver IOS Property Sourcing System
-"""
-
-        lines = methodology_text.strip().split("\n")
-        for i, line in enumerate(lines, start=1):
-            ws[f"A{i}"] = line
-            if line.isupper() and line.strip():
-                ws[f"A{i}"].font = Font(bold=True)
-
         ws.column_dimensions["A"].width = 80
 
+        for line, is_header in METHODOLOGY_LINES:
+            ws.append([self._cell(ws, line, font=Font(bold=True) if is_header else None)])
+
     def _prepare_display_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Prepare a DataFrame for display with ALL columns, priority columns first."""
 
@@ -488,34 +543,20 @@ Generated by Denver IOS Property Sourcing System
                 result_data[display_name] = df[found_col]
                 used_source_cols.add(found_col)
 
-        # Computed columns
+        # Computed columns (precomputed once per export by _enrich)
+        if "_acres" in df.columns:
+            result_data["Acres"] = df["_acres"]
 
-        # Calculate acres from sqft
-        parcel_sqft_col = self._find_column(df, "parcel_area_sqft")
-        if parcel_sqft_col and parcel_sqft_col in df.columns:
-            result_data["Acres"] = df[parcel_sqft_col] / 43560.0
+        if "_open_space_pct" in df.columns:
+            result_data["Open Space %"] = df["_open_space_pct"]
 
-        # Calculate open space %
-        coverage_col = self._find_column(df, "building_coverage_pct", "coverage_pct")
-        if coverage_col and coverage_col in df.columns:
-            result_data["Open Space %"] = 100 - df[coverage_col]
+        if "_lat" in df.columns and "_lon" in df.columns:
+            result_data["Lat"] = df["_lat"]
+            result_data["Lon"] = df["_lon"]
+            result_data["Google Maps Link"] = df["_gmaps_url"]
+            used_source_cols.update(CENTROID_COLUMNS)
 
-        # Generate coordinates from geometry
-        if "geometry" in df.columns:
-            try:
-                centroids = df.geometry.centroid
-                result_data["Lat"] = centroids.y
-                result_data["Lon"] = centroids.x
-                used_source_cols.add("geometry")
-
-                # Google Maps links
-                result_data["Google Maps Link"] = [
-                    f"https://www.google.com/maps?q={lat},{lon}"
-                    if pd.notna(lat) and pd.notna(lon) else ""
-                    for lat, lon in zip(centroids.y, centroids.x)
-                ]
-            except Exception:
-                pass
+        used_source_cols.update(COMPUTED_COLUMNS)
 
         # Calculate price per acre
         land_col = self._find_column(df, "actual_land_value")
@@ -549,81 +590,122 @@ Generated by Denver IOS Property Sourcing System
         df: pd.DataFrame,
         apply_grade_colors: bool = True,
     ) -> None:
-        """Write a DataFrame to a worksheet with formatting."""
-        # Write headers
-        for col_idx, col_name in enumerate(df.columns, start=1):
-            cell = ws.cell(row=1, column=col_idx, value=col_name)
-            cell.fill = HEADER_FILL
-            cell.font = HEADER_FONT
-            cell.border = THIN_BORDER
-            cell.alignment = Alignment(horizontal="center", wrap_text=True)
-
-        # Write data rows
-        grade_col_idx = None
-        if "Grade" in df.columns:
-            grade_col_idx = list(df.columns).index("Grade")
-
-        for row_idx, row in enumerate(df.itertuples(index=False), start=2):
-            grade = None
-            for col_idx, value in enumerate(row, start=1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-
-                # Handle different value types
-                if pd.isna(value):
-                    cell.value = ""
-                elif isinstance(value, float):
-                    # Format based on column name
-                    col_name = df.columns[col_idx - 1]
-                    if "%" in col_name or col_name in ["Building Coverage %", "Open Space %"]:
-                        cell.value = round(value, 1)
-                        cell.number_format = "0.0%"
-                    elif col_name in ["Total Assessed Value", "Land Value", "Price Per Acre",
-                                      "Actual Total Value", "Actual Land Value",
-                                      "Actual Improvement Value", "Assessed Total Value",
-                                      "Last Sale Price"]:
-                        cell.value = round(value, 0)
-                        cell.number_format = "$#,##0"
-                    elif col_name in ["Acres", "IOS Score"]:
-                        cell.value = round(value, 2)
-                    else:
-                        cell.value = value
-                elif hasattr(value, 'tzinfo') and value.tzinfo is not None:
-                    # Handle timezone-aware datetime by removing timezone
-                    cell.value = value.replace(tzinfo=None)
-                elif isinstance(value, (pd.Timestamp,)):
-                    # Handle pandas Timestamp
-                    if value.tzinfo is not None:
-                        cell.value = value.tz_localize(None).to_pydatetime()
-                    else:
-                        cell.value = value.to_pydatetime()
-                else:
-                    cell.value = value
-
-                # Track grade for row coloring
-                if col_idx - 1 == grade_col_idx:
-                    grade = value
-
-                cell.border = THIN_BORDER
-
-            # Apply grade-based row coloring
-            if apply_grade_colors and grade in GRADE_COLORS:
-                for col_idx in range(1, len(row) + 1):
-                    ws.cell(row=row_idx, column=col_idx).fill = GRADE_COLORS[grade]
-
-        # Auto-adjust column widths
-        for col_idx, col_name in enumerate(df.columns, start=1):
-            max_length = len(str(col_name))
-            for row_idx in range(2, min(102, len(df) + 2)):  # Check first 100 rows
-                cell_value = ws.cell(row=row_idx, column=col_idx).value
-                if cell_value:
-                    max_length = max(max_length, len(str(cell_value)))
-            ws.column_dimensions[ws.cell(row=1, column=col_idx).column_letter].width = min(
-                max_length + 2, 50
-            )
+        """
+        Write a DataFrame to a worksheet with formatting.
+
+        Rows are appended in order so the same code path works for regular
+        and write-only worksheets.
+        """
+        grade_col_idx = df.columns.get_loc("Grade") if "Grade" in df.columns else None
+
+        # Resolve float formatting once per column rather than per cell
+        col_fmts = [self._column_format(col_name) for col_name in df.columns]
+
+        # Size columns from the first 100 rows up front; write-only sheets
+        # reject column and pane settings once rows have been written
+        widths = [len(str(col_name)) for col_name in df.columns]
+        for row in zip(*self._column_arrays(df.iloc[:100])):
+            for i, (value, fmt) in enumerate(zip(row, col_fmts)):
+                value, _ = self._cell_value(value, fmt)
+                if value:
+                    widths[i] = max(widths[i], len(str(value)))
+        for col_idx, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(width + 2, 50)
 
         # Freeze header row
         ws.freeze_panes = "A2"
 
+        # Write headers
+        ws.append([
+            self._cell(ws, col_name, font=HEADER_FONT, fill=HEADER_FILL, alignment=HEADER_ALIGNMENT, border=THIN_BORDER)
+            for col_name in df.columns
+        ])
+
+        # Write rows in fixed-size blocks so only one block's column arrays
+        # are materialized at a time, keeping peak memory independent of the
+        # property count on large exports.
+        for start in range(0, len(df), ROW_CHUNK_SIZE):
+            block = df.iloc[start:start + ROW_CHUNK_SIZE]
+            for row in zip(*self._column_arrays(block)):
+                grade = row[grade_col_idx] if grade_col_idx is not None else None
+                fill = GRADE_COLORS.get(grade) if apply_grade_colors else None
+
+                cells = []
+                for value, fmt in zip(row, col_fmts):
+                    value, number_format = self._cell_value(value, fmt)
+                    cell = self._cell(ws, value, fill=fill, border=THIN_BORDER)
+                    if number_format:
+                        cell.number_format = number_format
+                    cells.append(cell)
+                ws.append(cells)
+
+    @staticmethod
+    def _cell(
+        ws: Worksheet,
+        value: Any,
+        font: Optional[Font] = None,
+        fill: Optional[PatternFill] = None,
+        alignment: Optional[Alignment] = None,
+        border: Optional[Border] = None,
+    ) -> WriteOnlyCell:
+        """Build a styled cell that can be appended to any worksheet."""
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        if border is not None:
+            cell.border = border
+        return cell
+
+    @staticmethod
+    def _cell_value(value: Any, fmt: Optional[tuple[int, Optional[str]]]) -> tuple[Any, Optional[str]]:
+        """Convert a raw DataFrame value to (cell value, number format)."""
+        if pd.isna(value):
+            return "", None
+        if isinstance(value, (float, np.floating)):
+            # Format based on the column's precomputed format
+            if fmt is not None:
+                digits, number_format = fmt
+                return round(value, digits), number_format
+            return value, None
+        if hasattr(value, 'tzinfo') and value.tzinfo is not None:
+            # Handle timezone-aware datetime by removing timezone
+            return value.replace(tzinfo=None), None
+        if isinstance(value, pd.Timestamp):
+            # Handle pandas Timestamp
+            return value.to_pydatetime(), None
+        return value, None
+
+    @staticmethod
+    def _column_format(col_name: str) -> Optional[tuple[int, Optional[str]]]:
+        """Return (decimal places, number format) for float cells in a column."""
+        if "%" in col_name:
+            return PERCENT_FORMAT
+        if col_name in CURRENCY_COLUMNS:
+            return CURRENCY_FORMAT
+        if col_name in DECIMAL_COLUMNS:
+            return DECIMAL_FORMAT
+        return None
+
+    @staticmethod
+    def _column_arrays(df: pd.DataFrame) -> list[np.ndarray]:
+        """
+        Extract raw per-column value arrays for row-wise writing.
+
+        Zipping these is cheaper than itertuples() on wide frames since no
+        namedtuple is built per row. Datetime columns are boxed to Timestamps
+        so timezone handling still applies when writing cells.
+        """
+        return [
+            series.to_numpy(dtype=object)
+            if pd.api.types.is_datetime64_any_dtype(series)
+            else series.to_numpy()
+            for _, series in df.items()
+        ]
+
     def _find_column(self, df: pd.DataFrame, *options: str) -> Optional[str]:
         """Find the first matching column from a list of options."""
         for opt in options:
@@ -641,6 +723,7 @@ def export_to_excel(
     output_dir: Path | str = "deliverables",
     filename: str = "denver_ios_analysis.xlsx",
     filter_criteria: Optional[dict[str, Any]] = None,
+    streaming: bool = False,
 ) -> Path:
     """
     Convenience function to export scored properties to Excel.
@@ -650,9 +733,10 @@ def export_to_excel(
         output_dir: Output directory
         filename: Output filename
         filter_criteria: Filter criteria used (for documentation)
+        streaming: Use a write-only workbook to keep memory flat on large exports
 
     Returns:
         Path to generated Excel file
     """
     exporter = ExcelExporter(output_dir)
-    return exporter.export(scored_df, filename, filter_criteria)
+    return exporter.export(scored_df, filename, filter_criteria, streaming=streaming)
@@ -1,14 +1,16 @@
 """
 Main script to generate all IOS analysis deliverables.
 
-Loads unified dataset, scores properties, and generates:
+Loads unified dataset, scores properties, and generates (concurrently):
 - Excel workbook with multi-sheet analysis
 - Interactive HTML map
 - CSV file for CRM import
 """
 
+import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -17,9 +19,6 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.acquisition.file_loader import AdamsCountyFileLoader
-from src.export.csv_exporter import export_to_csv
-from src.export.excel_exporter import export_to_excel
-from src.export.map_generator import generate_map
 from src.processing.data_integrator import PropertyDataIntegrator
 from src.scoring.ios_scorer import IOSScorer
 
@@ -31,8 +30,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main():
-    """Generate all IOS analysis deliverables."""
+def main(compress: bool = False):
+    """
+    Generate all IOS analysis deliverables.
+
+    Args:
+        compress: Gzip the full CRM CSV (written as denver_ios_crm.csv.gz)
+    """
     print("\n" + "=" * 60)
     print("DENVER IOS PROPERTY ANALYSIS - DELIVERABLE GENERATION")
     print("=" * 60 + "\n")
@@ -64,11 +68,10 @@ def main():
     scored_df = scorer.score_dataset(unified_df)
 
     # Get score distribution
-    grade_counts = scored_df["ios_grade"].value_counts().sort_index()
+    grade_counts = scored_df["ios_grade"].value_counts().reindex(list("ABCDF"), fill_value=0)
+    pcts = grade_counts / len(scored_df) * 100
     print("\n  Score Distribution:")
-    for grade in ["A", "B", "C", "D", "F"]:
-        count = grade_counts.get(grade, 0)
-        pct = count / len(scored_df) * 100
+    for grade, count, pct in zip(grade_counts.index, grade_counts, pcts):
         bar = "#" * int(pct / 2)
         print(f"    Grade {grade}: {count:4d} ({pct:5.1f}%) {bar}")
 
@@ -76,8 +79,13 @@ def main():
     b_count = grade_counts.get("B", 0)
     print(f"\n  High-priority candidates (A+B): {a_count + b_count}")
 
-    # Step 3: Generate Excel workbook
-    print("\nStep 3: Generating Excel workbook...")
+    # Steps 3-5: Generate deliverables. Exporters (openpyxl, folium) are
+    # imported here so startup and data loading are not held up by them.
+    from src.export.csv_exporter import export_to_csv
+    from src.export.excel_exporter import export_to_excel
+    from src.export.map_generator import MAP_COLUMNS, generate_map
+
+    print("\nSteps 3-5: Generating Excel workbook, interactive map, and CRM CSVs...")
     print("-" * 40)
 
     filter_criteria = {
@@ -88,12 +96,54 @@ def main():
         "Target Use": "Industrial Outdoor Storage (IOS)",
     }
 
-    excel_path = export_to_excel(
-        scored_df,
-        output_dir=deliverables_dir,
-        filename="denver_ios_analysis.xlsx",
-        filter_criteria=filter_criteria,
-    )
+    # Filter to A and B grades only for faster map loading. Consumers only
+    # read these frames, so no copy; the map gets just the columns it uses.
+    top_candidates_df = scored_df.loc[scored_df["ios_grade"].isin({"A", "B"})]
+    map_columns = [col for col in scored_df.columns if col.lower() in MAP_COLUMNS]
+    map_df = top_candidates_df[map_columns]
+    print(f"  Filtering to {len(top_candidates_df)} A/B grade properties for map...")
+
+    # The exporters share no state, so run them side by side - file writes
+    # and pandas/shapely C calls overlap instead of running back to back
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        excel_future = executor.submit(
+            export_to_excel,
+            scored_df,
+            output_dir=deliverables_dir,
+            filename="denver_ios_analysis.xlsx",
+            filter_criteria=filter_criteria,
+            streaming=True,
+        )
+        map_future = executor.submit(
+            generate_map,
+            map_df,
+            output_dir=deliverables_dir,
+            filename="denver_ios_map.html",
+            use_clustering=True,
+            tile_layers=("OpenStreetMap", "Satellite"),
+        )
+        csv_future = executor.submit(
+            export_to_csv,
+            scored_df,
+            output_dir=deliverables_dir,
+            filename="denver_ios_crm.csv",
+            min_grade=None,  # Include all
+            compress=compress,
+        )
+        # Reuse the A/B subset built for the map rather than re-filtering
+        csv_ab_future = executor.submit(
+            export_to_csv,
+            top_candidates_df,
+            output_dir=deliverables_dir,
+            filename="denver_ios_top_candidates.csv",
+            min_grade=None,
+        )
+
+        excel_path = excel_future.result()
+        map_path = map_future.result()
+        csv_path = csv_future.result()
+        csv_ab_path = csv_ab_future.result()
+
     print(f"  [OK] Excel workbook: {excel_path}")
     print(f"    - Executive Summary")
     print(f"    - Top Candidates ({a_count + b_count} A/B grade properties)")
@@ -101,48 +151,17 @@ def main():
     print(f"    - Map Data (GIS export)")
     print(f"    - Methodology")
 
-    # Step 4: Generate interactive map (A and B grade only for performance)
-    print("\nStep 4: Generating interactive HTML map...")
-    print("-" * 40)
-
-    # Filter to A and B grades only for faster map loading
-    top_candidates_df = scored_df[scored_df["ios_grade"].isin(["A", "B"])].copy()
-    print(f"  Filtering to {len(top_candidates_df)} A/B grade properties for map...")
-
-    map_path = generate_map(
-        top_candidates_df,
-        output_dir=deliverables_dir,
-        filename="denver_ios_map.html",
-        use_clustering=True,
-    )
     print(f"  [OK] Interactive map: {map_path}")
     print(f"    - {len(top_candidates_df)} A/B grade properties")
     print(f"    - Marker clustering enabled")
     print(f"    - Color-coded by grade (green=A, lightgreen=B)")
     print(f"    - Popups with property details and Google Maps links")
 
-    # Step 5: Generate CRM CSV
-    print("\nStep 5: Generating CRM CSV...")
-    print("-" * 40)
-
-    csv_path = export_to_csv(
-        scored_df,
-        output_dir=deliverables_dir,
-        filename="denver_ios_crm.csv",
-        min_grade=None,  # Include all
-    )
     print(f"  [OK] CRM CSV: {csv_path}")
     print(f"    - {len(scored_df)} records")
     print(f"    - Clean column names for CRM import")
     print(f"    - Includes Google Maps URLs")
 
-    # Also generate A/B only CSV
-    csv_ab_path = export_to_csv(
-        scored_df,
-        output_dir=deliverables_dir,
-        filename="denver_ios_top_candidates.csv",
-        min_grade="B",
-    )
     print(f"  [OK] Top candidates CSV: {csv_ab_path}")
     print(f"    - {a_count + b_count} A/B grade records only")
 
@@ -154,7 +173,7 @@ def main():
     print(f"\nGenerated files in: {deliverables_dir}")
     print(f"  1. denver_ios_analysis.xlsx   - Full Excel workbook")
     print(f"  2. denver_ios_map.html         - Interactive map")
-    print(f"  3. denver_ios_crm.csv          - All properties for CRM")
+    print(f"  3. {csv_path.name:<28} - All properties for CRM")
     print(f"  4. denver_ios_top_candidates.csv - A/B grade only")
     print(f"\nTotal time: {elapsed.total_seconds():.1f} seconds")
     print(f"\nKey Statistics:")
@@ -166,4 +185,11 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate all IOS analysis deliverables.")
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="gzip the full CRM CSV (denver_ios_crm.csv.gz)",
+    )
+    args = parser.parse_args()
+    main(compress=args.compress)
@@ -5,13 +5,27 @@ Generates HTML maps using Folium with marker clusters and
 grade-based color coding for property visualization.
 """
 
+import importlib.util
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
-import folium
+import numpy as np
 import pandas as pd
-from folium.plugins import MarkerCluster
+import shapely
+
+if TYPE_CHECKING:
+    import folium
+
+try:
+    import numba
+
+    _NUMBA_AVAILABLE = True
+except ImportError:  # optional accelerator
+    _NUMBA_AVAILABLE = False
+
+# Optional string backend; only probed here, pandas imports it on use
+_PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +33,25 @@ logger = logging.getLogger(__name__)
 DEFAULT_CENTER = (39.82026, -104.90811)
 DEFAULT_ZOOM = 11
 
+# Optional tile layers on top of the OpenStreetMap base layer, by layer name
+TILE_LAYERS = {
+    "Light": {"tiles": "cartodbpositron"},
+    "Dark": {"tiles": "cartodbdark_matter"},
+    "Satellite": {
+        "tiles": "https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
+        "attr": "Esri",
+    },
+    "Google Satellite": {
+        "tiles": "https://mt1.google.com/vt/lyrs=s&x={x}&y={y}&z={z}",
+        "attr": "Google",
+    },
+    "Google Hybrid": {
+        "tiles": "https://mt1.google.com/vt/lyrs=y&x={x}&y={y}&z={z}",
+        "attr": "Google",
+    },
+}
+BASE_TILE_LAYER = "OpenStreetMap"
+
 # Marker colors by grade
 GRADE_COLORS = {
     "A": "green",
@@ -28,6 +61,15 @@ GRADE_COLORS = {
     "F": "red",
 }
 
+# Popup score banner colors by grade (matches the legend)
+GRADE_TEXT_COLORS = {
+    "A": "#28a745",
+    "B": "#5cb85c",
+    "C": "#ffc107",
+    "D": "#fd7e14",
+    "F": "#dc3545",
+}
+
 # Marker icons by grade
 GRADE_ICONS = {
     "A": "star",
@@ -37,6 +79,136 @@ GRADE_ICONS = {
     "F": "remove-sign",
 }
 
+# Grade categories plus color/icon lookup arrays indexed by category code;
+# the trailing entry is the fallback for unknown grades
+GRADE_INDEX = pd.Index(list(GRADE_COLORS))
+MARKER_COLOR_LOOKUP = np.array([*GRADE_COLORS.values(), "gray"], dtype=object)
+MARKER_ICON_LOOKUP = np.array([*(GRADE_ICONS[g] for g in GRADE_INDEX), "info-sign"], dtype=object)
+
+# Layer control names for the per-grade marker groups, same indexing
+MARKER_GROUP_NAMES = [*(f"Grade {g}" for g in GRADE_INDEX), "Other"]
+
+# Lookup index selected for grades outside GRADE_INDEX
+FALLBACK_MARKER_CODE = len(GRADE_INDEX)
+
+
+def _prepare_marker_arrays_numpy(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    grade_codes: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the coordinate validity mask and marker lookup codes.
+
+    Args:
+        lat: Latitudes as float64 (NaN where missing)
+        lon: Longitudes as float64 (NaN where missing)
+        grade_codes: Integer grade codes from GRADE_INDEX (-1 if unknown)
+
+    Returns:
+        Tuple of (valid mask, int8 index into the marker lookup arrays)
+    """
+    valid = (
+        (lat >= -90) & (lat <= 90)
+        & (lon >= -180) & (lon <= 180)
+        & (lat != 0) & (lon != 0)
+    )
+    codes = np.where(grade_codes < 0, FALLBACK_MARKER_CODE, grade_codes).astype(np.int8)
+    return valid, codes
+
+
+if _NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True, parallel=True)
+    def _prepare_marker_arrays(lat, lon, grade_codes):
+        """JIT-compiled equivalent of _prepare_marker_arrays_numpy."""
+        n = lat.shape[0]
+        valid = np.empty(n, dtype=np.bool_)
+        codes = np.empty(n, dtype=np.int8)
+        for i in numba.prange(n):
+            la = lat[i]
+            lo = lon[i]
+            valid[i] = -90 <= la <= 90 and -180 <= lo <= 180 and la != 0 and lo != 0
+            code = grade_codes[i]
+            codes[i] = FALLBACK_MARKER_CODE if code < 0 else code
+        return valid, codes
+
+else:
+    _prepare_marker_arrays = _prepare_marker_arrays_numpy
+
+# Leaflet callback used by FastMarkerCluster to build each marker in the
+# browser from a [lat, lon, color, icon, popup_html, tooltip] data row
+MARKER_CALLBACK = """function (row) {
+    var icon = L.AwesomeMarkers.icon({
+        icon: row[3],
+        iconColor: "white",
+        markerColor: row[2],
+        prefix: "glyphicon",
+    });
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+    marker.bindPopup(row[4], {maxWidth: 350});
+    marker.bindTooltip(row[5], {sticky: true});
+    return marker;
+}"""
+
+# Marker popup HTML, filled per property via str.format_map
+POPUP_TEMPLATE = """
+        <div style="font-family: Arial, sans-serif; min-width: 320px;">
+            <h4 style="margin: 0 0 10px 0; color: #333;">{full_address}</h4>
+            <div style="background: {grade_color}; color: white; padding: 8px; border-radius: 4px; margin-bottom: 10px; text-align: center;">
+                <strong>IOS Score: {score}</strong> | <strong>Grade: {grade}</strong>
+            </div>
+            <table style="width: 100%; font-size: 12px; border-collapse: collapse;">
+                <tr><td style="padding: 3px; font-weight: bold;">Parcel ID:</td><td style="padding: 3px;">{parcel_id}</td></tr>
+                <tr><td style="padding: 3px; font-weight: bold;">Acres:</td><td style="padding: 3px;">{acres}</td></tr>
+                <tr><td style="padding: 3px; font-weight: bold;">Building Coverage:</td><td style="padding: 3px;">{coverage}</td></tr>
+                <tr><td style="padding: 3px; font-weight: bold;">Zoning:</td><td style="padding: 3px;">{zoning}</td></tr>
+                <tr><td style="padding: 3px; font-weight: bold;">Owner:</td><td style="padding: 3px;">{owner}</td></tr>
+                <tr><td style="padding: 3px; font-weight: bold;">Property Type:</td><td style="padding: 3px;">{property_type}</td></tr>
+                <tr><td style="padding: 3px; font-weight: bold;">Year Built:</td><td style="padding: 3px;">{year_built}</td></tr>
+                <tr><td style="padding: 3px; font-weight: bold;">Actual Value:</td><td style="padding: 3px;">{actual_value}</td></tr>
+                <tr><td style="padding: 3px; font-weight: bold;">Assessed Value:</td><td style="padding: 3px;">{assessed}</td></tr>
+                <tr><td style="padding: 3px; font-weight: bold;">Last Sale:</td><td style="padding: 3px;">{last_sale_price} ({last_sale_date})</td></tr>
+            </table>
+            <div style="margin-top: 10px; text-align: center;">
+                <a href="{gmaps_link}" target="_blank" style="color: #007bff; text-decoration: none;">
+                    Open in Google Maps
+                </a>
+            </div>
+        </div>
+        """
+
+# Popup/tooltip fields -> candidate source columns, in priority order
+FIELD_COLUMNS = {
+    "address": ("address", "concataddr1", "situs_address", "full_address"),
+    "parcel_id": ("parcel_id", "PARCELNB", "accountno", "parcelid"),
+    "score": ("ios_score", "score"),
+    "grade": ("ios_grade", "grade"),
+    "acres": ("acres", "calc_acreage", "parcel_acres"),
+    "parcel_sqft": ("parcel_area_sqft", "parcel_sqft", "Shape_Area"),
+    "coverage": ("building_coverage_pct", "coverage_pct"),
+    "zoning": ("zoning_code", "zoning", "zone"),
+    "owner": ("owner_name", "ownernamefull", "ownername1", "owner", "owner1"),
+    "assessed": ("assessed_total_value", "total_assessed", "assessed_value", "total_value"),
+    "city": ("city", "loccity"),
+    "actual_value": ("actual_total_value",),
+    "last_sale_price": ("last_sale_price",),
+    "last_sale_date": ("last_sale_date",),
+    "year_built": ("year_built", "oldest_year_built"),
+    "property_type": ("property_type",),
+}
+
+# Every column MapGenerator may read (lowercased; lookups are case-insensitive)
+MAP_COLUMNS = frozenset(
+    col.lower()
+    for col in (
+        "lat", "latitude", "centroid_lat",
+        "lon", "longitude", "lng", "centroid_lon",
+        "geometry",
+        *(opt for options in FIELD_COLUMNS.values() for opt in options),
+    )
+)
+
 
 class MapGenerator:
     """Generate interactive HTML maps for IOS property analysis."""
@@ -59,6 +231,8 @@ class MapGenerator:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.center = center
         self.zoom = zoom
+        self._col_index: dict[str, str] = {}
+        self._col_index_columns: Optional[pd.Index] = None
 
     def generate(
         self,
@@ -66,6 +240,7 @@ class MapGenerator:
         filename: str = "denver_ios_map.html",
         use_clustering: bool = True,
         max_markers: Optional[int] = None,
+        tile_layers: Optional[Sequence[str]] = None,
     ) -> Path:
         """
         Generate an interactive HTML map of scored properties.
@@ -75,10 +250,16 @@ class MapGenerator:
             filename: Output filename
             use_clustering: Whether to use marker clustering
             max_markers: Maximum number of markers to display (None for all)
+            tile_layers: Names from TILE_LAYERS to offer in the layer control
+                (None for all); OpenStreetMap is always the base layer
 
         Returns:
             Path to the generated HTML file
         """
+        # folium is slow to import, so defer it until a map is actually built
+        import folium
+        from folium.plugins import FastMarkerCluster
+
         output_path = self.output_dir / filename
         logger.info(f"Generating interactive map: {output_path}")
 
@@ -86,34 +267,20 @@ class MapGenerator:
         m = folium.Map(
             location=self.center,
             zoom_start=self.zoom,
-            tiles="OpenStreetMap",
+            tiles=BASE_TILE_LAYER,
         )
 
-        # Add alternative tile layers
-        folium.TileLayer("cartodbpositron", name="Light").add_to(m)
-        folium.TileLayer("cartodbdark_matter", name="Dark").add_to(m)
-
-        # Add satellite imagery layers
-        folium.TileLayer(
-            tiles="https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
-            attr="Esri",
-            name="Satellite",
-        ).add_to(m)
-
-        folium.TileLayer(
-            tiles="https://mt1.google.com/vt/lyrs=s&x={x}&y={y}&z={z}",
-            attr="Google",
-            name="Google Satellite",
-        ).add_to(m)
-
-        folium.TileLayer(
-            tiles="https://mt1.google.com/vt/lyrs=y&x={x}&y={y}&z={z}",
-            attr="Google",
-            name="Google Hybrid",
-        ).add_to(m)
+        # Add requested tile layers (the base layer is always present)
+        for name in TILE_LAYERS if tile_layers is None else tile_layers:
+            if name == BASE_TILE_LAYER:
+                continue
+            if name not in TILE_LAYERS:
+                logger.warning(f"Unknown tile layer '{name}', skipping")
+                continue
+            folium.TileLayer(name=name, **TILE_LAYERS[name]).add_to(m)
 
-        # Prepare data
-        df = scored_df.copy()
+        # Prepare data (copy with text columns moved to Arrow-backed strings)
+        df = self._to_arrow_strings(scored_df)
 
         # Get coordinate columns
         lat_col = self._find_column(df, "lat", "latitude", "centroid_lat")
@@ -123,10 +290,10 @@ class MapGenerator:
         if (not lat_col or not lon_col) and "geometry" in df.columns:
             logger.info("Extracting coordinates from geometry centroids...")
             try:
-                # Get centroids of geometries
-                centroids = df.geometry.centroid
-                df["_map_lat"] = centroids.y
-                df["_map_lon"] = centroids.x
+                # Vectorized shapely centroids (runs in C, no per-geometry Python)
+                centroids = shapely.centroid(df.geometry.values)
+                df["_map_lat"] = shapely.get_y(centroids)
+                df["_map_lon"] = shapely.get_x(centroids)
                 lat_col = "_map_lat"
                 lon_col = "_map_lon"
                 logger.info(f"Extracted {len(df)} centroids from geometry")
@@ -139,13 +306,23 @@ class MapGenerator:
             m.save(output_path)
             return output_path
 
-        # Filter to valid coordinates
-        valid_coords = df[
-            df[lat_col].notna()
-            & df[lon_col].notna()
-            & (df[lat_col] != 0)
-            & (df[lon_col] != 0)
-        ].copy()
+        # Encode grades once, then compute the coordinate mask and marker
+        # lookup codes in a single pass (JIT-compiled when numba is installed)
+        lats = pd.to_numeric(df[lat_col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        lons = pd.to_numeric(df[lon_col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        grade_col = self._find_column(df, "ios_grade", "grade")
+        if grade_col:
+            grade_codes = GRADE_INDEX.get_indexer(df[grade_col].fillna("C"))
+        else:
+            grade_codes = np.full(len(df), GRADE_INDEX.get_loc("C"))
+        valid_mask, marker_codes = _prepare_marker_arrays(lats, lons, grade_codes)
+
+        valid_coords = df[valid_mask].copy()
+        valid_coords[lat_col] = lats[valid_mask]
+        valid_coords[lon_col] = lons[valid_mask]
+        valid_coords["_color"] = MARKER_COLOR_LOOKUP[marker_codes[valid_mask]]
+        valid_coords["_icon"] = MARKER_ICON_LOOKUP[marker_codes[valid_mask]]
+        valid_coords["_marker_code"] = marker_codes[valid_mask]
 
         logger.info(f"Properties with valid coordinates: {len(valid_coords)}")
 
@@ -158,50 +335,50 @@ class MapGenerator:
             else:
                 valid_coords = valid_coords.head(max_markers)
 
-        # Create marker cluster or feature groups by grade
-        if use_clustering:
-            marker_cluster = MarkerCluster(name="All Properties")
-            marker_cluster.add_to(m)
-            marker_container = marker_cluster
-        else:
-            marker_container = m
+        # Resolve source columns once and pull every popup field out as a flat
+        # array, so the marker loop iterates raw values instead of Series rows
+        fields = self._field_arrays(valid_coords, self._resolve_columns(valid_coords))
+        field_names = list(fields)
+
+        # Build popup and tooltip content
+        lats = valid_coords[lat_col].to_numpy()
+        lons = valid_coords[lon_col].to_numpy()
+        popup_fields = self._popup_fields(fields, lats, lons)
+        popups = [
+            POPUP_TEMPLATE.format_map(dict(zip(popup_fields, row)))
+            for row in zip(*popup_fields.values())
+        ]
+        tooltips = [
+            self._build_tooltip(dict(zip(field_names, field_values)))
+            for field_values in zip(*fields.values())
+        ]
 
         # Add markers
-        grade_col = self._find_column(valid_coords, "ios_grade", "grade")
-        score_col = self._find_column(valid_coords, "ios_score", "score")
-
-        markers_added = 0
-        for _, row in valid_coords.iterrows():
-            try:
-                lat = float(row[lat_col])
-                lon = float(row[lon_col])
-
-                # Skip invalid coordinates
-                if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
-                    continue
-
-                # Get grade and color
-                grade = row[grade_col] if grade_col and pd.notna(row[grade_col]) else "C"
-                color = GRADE_COLORS.get(grade, "gray")
-                icon = GRADE_ICONS.get(grade, "info-sign")
-
-                # Build popup content
-                popup_html = self._build_popup(row, lat, lon)
-
-                # Create marker
-                marker = folium.Marker(
-                    location=[lat, lon],
-                    popup=folium.Popup(popup_html, max_width=350),
-                    icon=folium.Icon(color=color, icon=icon, prefix="glyphicon"),
-                    tooltip=self._build_tooltip(row),
-                )
-
-                marker.add_to(marker_container)
-                markers_added += 1
-
-            except (ValueError, TypeError) as e:
-                logger.debug(f"Skipping row due to error: {e}")
+        colors = valid_coords["_color"].to_numpy()
+        icons = valid_coords["_icon"].to_numpy()
+        codes = valid_coords["_marker_code"].to_numpy()
+        rows = list(zip(lats, lons, colors, icons, popups, tooltips))
+
+        # One toggleable layer per grade, so clusters only form within a grade
+        for code, group_name in enumerate(MARKER_GROUP_NAMES):
+            group_rows = [rows[i] for i in np.flatnonzero(codes == code)]
+            if not group_rows:
                 continue
+            group = folium.FeatureGroup(name=group_name).add_to(m)
+
+            if use_clustering:
+                # Ship marker data as one JSON array and build markers in the
+                # browser instead of creating a folium object graph per property
+                FastMarkerCluster(data=group_rows, callback=MARKER_CALLBACK).add_to(group)
+            else:
+                for lat, lon, color, icon, popup_html, tooltip in group_rows:
+                    folium.Marker(
+                        location=[lat, lon],
+                        popup=folium.Popup(popup_html, max_width=350),
+                        icon=folium.Icon(color=color, icon=icon, prefix="glyphicon"),
+                        tooltip=tooltip,
+                    ).add_to(group)
+        markers_added = len(popups)
 
         logger.info(f"Added {markers_added} markers to map")
 
@@ -217,94 +394,65 @@ class MapGenerator:
 
         return output_path
 
-    def _build_popup(self, row: pd.Series, lat: float, lon: float) -> str:
-        """Build HTML popup content for a marker."""
-        # Get values with fallbacks - check both raw source columns and cleaned export columns
-        address = self._get_value(row, "address", "concataddr1", "situs_address", "full_address") or "Unknown"
-        parcel_id = self._get_value(row, "parcel_id", "PARCELNB", "accountno", "parcelid") or "N/A"
-        score = self._get_value(row, "ios_score", "score")
-        grade = self._get_value(row, "ios_grade", "grade") or "N/A"
-
-        # Calculate acres from parcel_area_sqft if acres not directly available
-        acres = self._get_value(row, "acres", "calc_acreage", "parcel_acres")
-        if acres is None:
-            parcel_sqft = self._get_value(row, "parcel_area_sqft", "parcel_sqft", "Shape_Area")
-            if parcel_sqft:
-                acres = parcel_sqft / 43560.0
-
-        coverage = self._get_value(row, "building_coverage_pct", "coverage_pct")
-        zoning = self._get_value(row, "zoning_code", "zoning", "zone") or "N/A"
-        owner = self._get_value(row, "owner_name", "ownernamefull", "ownername1", "owner", "owner1") or "N/A"
-        assessed = self._get_value(row, "assessed_total_value", "total_assessed", "assessed_value", "total_value")
-
-        # Additional useful fields
-        city = self._get_value(row, "city", "loccity") or ""
-        actual_value = self._get_value(row, "actual_total_value")
-        last_sale_price = self._get_value(row, "last_sale_price")
-        last_sale_date = self._get_value(row, "last_sale_date")
-        year_built = self._get_value(row, "year_built", "oldest_year_built")
-        property_type = self._get_value(row, "property_type")
-
-        # Format values
-        score_str = f"{score:.1f}" if score else "N/A"
-        acres_str = f"{acres:.2f}" if acres else "N/A"
-        coverage_str = f"{coverage:.1f}%" if coverage else "N/A"
-        assessed_str = f"${assessed:,.0f}" if assessed else "N/A"
-        actual_str = f"${actual_value:,.0f}" if actual_value else "N/A"
-        sale_price_str = f"${last_sale_price:,.0f}" if last_sale_price else "N/A"
-        sale_date_str = str(last_sale_date)[:10] if last_sale_date else "N/A"
-        year_built_str = str(int(year_built)) if year_built else "N/A"
-
-        # Google Maps link
-        gmaps_link = f"https://www.google.com/maps?q={lat},{lon}"
-
-        # Grade color
-        grade_colors = {
-            "A": "#28a745",
-            "B": "#5cb85c",
-            "C": "#ffc107",
-            "D": "#fd7e14",
-            "F": "#dc3545",
-        }
-        grade_color = grade_colors.get(grade, "#6c757d")
-
-        # Format address with city
-        full_address = f"{address}, {city}" if city else address
+    def _popup_fields(
+        self,
+        fields: dict[str, np.ndarray],
+        lats: np.ndarray,
+        lons: np.ndarray,
+    ) -> dict[str, list[str]]:
+        """
+        Format every POPUP_TEMPLATE placeholder for all markers up front.
 
-        popup_html = f"""
-        <div style="font-family: Arial, sans-serif; min-width: 320px;">
-            <h4 style="margin: 0 0 10px 0; color: #333;">{full_address}</h4>
-            <div style="background: {grade_color}; color: white; padding: 8px; border-radius: 4px; margin-bottom: 10px; text-align: center;">
-                <strong>IOS Score: {score_str}</strong> | <strong>Grade: {grade}</strong>
-            </div>
-            <table style="width: 100%; font-size: 12px; border-collapse: collapse;">
-                <tr><td style="padding: 3px; font-weight: bold;">Parcel ID:</td><td style="padding: 3px;">{parcel_id}</td></tr>
-                <tr><td style="padding: 3px; font-weight: bold;">Acres:</td><td style="padding: 3px;">{acres_str}</td></tr>
-                <tr><td style="padding: 3px; font-weight: bold;">Building Coverage:</td><td style="padding: 3px;">{coverage_str}</td></tr>
-                <tr><td style="padding: 3px; font-weight: bold;">Zoning:</td><td style="padding: 3px;">{zoning}</td></tr>
-                <tr><td style="padding: 3px; font-weight: bold;">Owner:</td><td style="padding: 3px;">{owner}</td></tr>
-                <tr><td style="padding: 3px; font-weight: bold;">Property Type:</td><td style="padding: 3px;">{property_type or 'N/A'}</td></tr>
-                <tr><td style="padding: 3px; font-weight: bold;">Year Built:</td><td style="padding: 3px;">{year_built_str}</td></tr>
-                <tr><td style="padding: 3px; font-weight: bold;">Actual Value:</td><td style="padding: 3px;">{actual_str}</td></tr>
-                <tr><td style="padding: 3px; font-weight: bold;">Assessed Value:</td><td style="padding: 3px;">{assessed_str}</td></tr>
-                <tr><td style="padding: 3px; font-weight: bold;">Last Sale:</td><td style="padding: 3px;">{sale_price_str} ({sale_date_str})</td></tr>
-            </table>
-            <div style="margin-top: 10px; text-align: center;">
-                <a href="{gmaps_link}" target="_blank" style="color: #007bff; text-decoration: none;">
-                    Open in Google Maps
-                </a>
-            </div>
-        </div>
+        Returns one list of display strings per placeholder so each popup is
+        a single format_map call with no per-row formatting logic.
         """
+        def money(values: np.ndarray) -> list[str]:
+            return [f"${v:,.0f}" if v else "N/A" for v in values]
+
+        def text(values: np.ndarray) -> list[str]:
+            return [v or "N/A" for v in values]
+
+        # Format address with city as vectorized string concatenation
+        addresses = pd.Series(fields["address"], dtype=object)
+        addresses = addresses.where(addresses.astype(bool), "Unknown").astype(str)
+        cities = pd.Series(fields["city"], dtype=object)
+        has_city = cities.astype(bool)
+        full_addresses = addresses.where(~has_city, addresses + ", " + cities.where(has_city, "").astype(str))
+
+        # Google Maps links
+        gmaps_links = (
+            "https://www.google.com/maps?q="
+            + pd.Series(lats, dtype=float).astype(str)
+            + ","
+            + pd.Series(lons, dtype=float).astype(str)
+        )
 
-        return popup_html
+        grades = text(fields["grade"])
+        return {
+            "full_address": full_addresses.tolist(),
+            "grade_color": [GRADE_TEXT_COLORS.get(grade, "#6c757d") for grade in grades],
+            "score": [f"{v:.1f}" if v else "N/A" for v in fields["score"]],
+            "grade": grades,
+            "parcel_id": text(fields["parcel_id"]),
+            "acres": [f"{v:.2f}" if v else "N/A" for v in fields["acres"]],
+            "coverage": [f"{v:.1f}%" if v else "N/A" for v in fields["coverage"]],
+            "zoning": text(fields["zoning"]),
+            "owner": text(fields["owner"]),
+            "property_type": text(fields["property_type"]),
+            "year_built": [str(int(v)) if v else "N/A" for v in fields["year_built"]],
+            "actual_value": money(fields["actual_value"]),
+            "assessed": money(fields["assessed"]),
+            "last_sale_price": money(fields["last_sale_price"]),
+            "last_sale_date": [str(v)[:10] if v else "N/A" for v in fields["last_sale_date"]],
+            "gmaps_link": gmaps_links.tolist(),
+        }
 
-    def _build_tooltip(self, row: pd.Series) -> str:
+    def _build_tooltip(self, values: dict[str, Any]) -> str:
         """Build tooltip text for hover."""
-        address = self._get_value(row, "address", "concataddr1", "situs_address", "full_address") or "Unknown"
-        city = self._get_value(row, "city", "loccity") or ""
-        score = self._get_value(row, "ios_score", "score")
-        grade = self._get_value(row, "ios_grade", "grade")
+        address = values["address"] or "Unknown"
+        city = values["city"] or ""
+        score = values["score"]
+        grade = values["grade"]
 
         score_str = f"{score:.1f}" if score else "N/A"
         grade_str = f" ({grade})" if grade else ""
@@ -312,8 +460,10 @@ class MapGenerator:
 
         return f"{full_address} - Score: {score_str}{grade_str}"
 
-    def _add_legend(self, m: folium.Map) -> None:
+    def _add_legend(self, m: "folium.Map") -> None:
         """Add a legend to the map."""
+        import folium
+
         legend_html = """
         <div style="
             position: fixed;
@@ -337,27 +487,98 @@ class MapGenerator:
         """
         m.get_root().html.add_child(folium.Element(legend_html))
 
+    @staticmethod
+    def _to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return a copy of df with object-dtype text columns as string[pyarrow].
+
+        Arrow strings live in one contiguous buffer, so the notna/where passes
+        over popup fields run in C instead of per Python object. Without
+        pyarrow installed this is a plain copy.
+        """
+        if not _PYARROW_AVAILABLE:
+            return df.copy()
+
+        string_cols = {
+            col: "string[pyarrow]"
+            for col in df.columns
+            if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) == "string"
+        }
+        return df.astype(string_cols)
+
     def _find_column(self, df: pd.DataFrame, *options: str) -> Optional[str]:
         """Find the first matching column from a list of options."""
+        # Case-insensitive lookup, rebuilt only when the column set changes
+        if self._col_index_columns is None or not self._col_index_columns.equals(df.columns):
+            self._col_index = self._column_index(df)
+            self._col_index_columns = df.columns
+        col_index = self._col_index
         for opt in options:
             if opt in df.columns:
                 return opt
             # Try case-insensitive match
-            for col in df.columns:
-                if col.lower() == opt.lower():
-                    return col
+            col = col_index.get(opt.lower())
+            if col is not None:
+                return col
         return None
 
-    def _get_value(self, row: pd.Series, *column_options: str):
-        """Get value from row, trying multiple column names."""
-        for col in column_options:
-            if col in row.index and pd.notna(row[col]):
-                return row[col]
-            # Try case-insensitive
-            for idx in row.index:
-                if idx.lower() == col.lower() and pd.notna(row[idx]):
-                    return row[idx]
-        return None
+    @staticmethod
+    def _column_index(df: pd.DataFrame) -> dict[str, str]:
+        """Map each lowercased column name to the first column with that name."""
+        col_index: dict[str, str] = {}
+        for col in df.columns:
+            col_index.setdefault(col.lower(), col)
+        return col_index
+
+    def _resolve_columns(self, df: pd.DataFrame) -> dict[str, list[str]]:
+        """
+        Resolve each popup field to the source columns present in df.
+
+        Matching is case-insensitive and done in a single pass over the
+        columns. Matches keep FIELD_COLUMNS priority order so that values
+        can fall back to later columns when earlier ones are empty.
+        """
+        by_lower: dict[str, list[str]] = {}
+        for col in df.columns:
+            by_lower.setdefault(col.lower(), []).append(col)
+
+        resolved = {}
+        for field, options in FIELD_COLUMNS.items():
+            cols = []
+            for opt in options:
+                matches = [opt] if opt in df.columns else []
+                for col in matches + by_lower.get(opt.lower(), []):
+                    if col not in cols:
+                        cols.append(col)
+            resolved[field] = cols
+        return resolved
+
+    def _field_arrays(
+        self,
+        df: pd.DataFrame,
+        resolved: dict[str, list[str]],
+    ) -> dict[str, np.ndarray]:
+        """
+        Extract each popup field as an object array with None for missing values.
+
+        Multiple source columns for a field are coalesced in priority order.
+        """
+        series = {}
+        for field, cols in resolved.items():
+            values = pd.Series(None, index=df.index, dtype=object)
+            for col in cols:
+                values = values.where(values.notna(), df[col])
+            series[field] = values
+
+        # Calculate acres from parcel sqft where acres are not directly available
+        series["acres"] = series["acres"].where(
+            series["acres"].notna(), series["parcel_sqft"] / 43560.0
+        )
+
+        return {
+            field: values.astype(object).where(values.notna(), None).to_numpy()
+            for field, values in series.items()
+        }
 
 
 def generate_map(
@@ -366,6 +587,7 @@ def generate_map(
     filename: str = "denver_ios_map.html",
     center: tuple[float, float] = DEFAULT_CENTER,
     use_clustering: bool = True,
+    tile_layers: Optional[Sequence[str]] = None,
 ) -> Path:
     """
     Convenience function to generate an interactive map.
@@ -376,9 +598,12 @@ def generate_map(
         filename: Output filename
         center: Map center coordinates
         use_clustering: Whether to use marker clustering
+        tile_layers: Tile layer names to include (None for all)
 
     Returns:
         Path to generated HTML file
     """
     generator = MapGenerator(output_dir, center=center)
-    return generator.generate(scored_df, filename, use_clustering=use_clustering)
+    return generator.generate(
+        scored_df, filename, use_clustering=use_clustering, tile_layers=tile_layers
+    )
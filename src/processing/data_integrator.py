@@ -15,18 +15,30 @@ Join Key Analysis:
 Strategy: Use parcelnb/PARCELNB as the primary join key (more consistent).
 """
 
+import hashlib
+import importlib.util
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import geopandas as gpd
 import pandas as pd
 import numpy as np
+import pyogrio
+import shapely
 
 from src.acquisition import AdamsCountyFileLoader, BoundingBox, TargetArea
 
 logger = logging.getLogger(__name__)
 
+# pyarrow is optional: enables Arrow-backed strings and pyogrio's Arrow reads
+_PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# Arrow-backed strings when pyarrow is installed, else pandas' own string dtype
+PARCEL_ID_DTYPE = "string[pyarrow]" if _PYARROW_AVAILABLE else "string"
+
 # Column name mappings for standardization
 PARCEL_COLUMNS = {
     "PIN": "pin",
@@ -77,6 +89,13 @@ SALES_COLUMNS = {
     "grantee": "buyer",
 }
 
+# Bump to invalidate cached merged frames when the merge logic changes
+MERGE_CACHE_VERSION = 2
+
+# Building joins with at least this many footprints split the parcel-tree
+# query across threads (GEOS releases the GIL during STRtree queries)
+PARALLEL_QUERY_MIN_FEATURES = 100_000
+
 BUILDINGS_COLUMNS = {
     "PIN": "pin",
     "PARCELNB": "parcel_id",
@@ -106,12 +125,14 @@ class PropertyDataIntegrator:
 
     Attributes:
         loader: AdamsCountyFileLoader instance for loading raw data.
+        cache_dir: Directory for cached merged property frames, or None.
     """
 
     def __init__(
         self,
         loader: Optional[AdamsCountyFileLoader] = None,
         project_root: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
     ) -> None:
         """
         Initialize the data integrator.
@@ -119,8 +140,12 @@ class PropertyDataIntegrator:
         Args:
             loader: Optional AdamsCountyFileLoader. Created if not provided.
             project_root: Project root directory for file paths.
+            cache_dir: Optional directory to cache the merged parcels/values/
+                improvements frame as GeoParquet (requires pyarrow). Caching
+                is disabled if not provided.
         """
         self.loader = loader or AdamsCountyFileLoader(project_root=project_root)
+        self.cache_dir = cache_dir
         logger.info("Initialized PropertyDataIntegrator")
 
     def explore_join_keys(self) -> dict[str, dict[str, Any]]:
@@ -133,8 +158,6 @@ class PropertyDataIntegrator:
         Returns:
             Dictionary with dataset names as keys and join key info as values.
         """
-        import fiona
-
         results = {}
 
         datasets = [
@@ -153,33 +176,40 @@ class PropertyDataIntegrator:
             print(f"\n{name}:")
             print("-" * 50)
 
-            with fiona.open(str(path), layer=layer) as src:
-                fields = list(src.schema["properties"].keys())
-
-                # Find potential join keys
-                key_patterns = ["PIN", "PARCEL", "ACCOUNT", "ID"]
-                potential_keys = [
-                    f for f in fields
-                    if any(k in f.upper() for k in key_patterns)
-                ]
-
-                # Get sample values
-                samples = {}
-                rec = next(iter(src))
-                for key in potential_keys:
-                    samples[key] = rec["properties"].get(key)
-
-                results[name] = {
-                    "potential_keys": potential_keys,
-                    "sample_values": samples,
-                    "record_count": len(src),
-                }
-
-                print(f"  Record count: {len(src):,}")
-                print(f"  Potential join columns: {potential_keys}")
-                print("  Sample values:")
-                for key, val in samples.items():
-                    print(f"    {key}: {val!r}")
+            # Layer metadata (fields, feature count) without reading records
+            info = pyogrio.read_info(str(path), layer=layer)
+            fields = list(info["fields"])
+            record_count = info["features"]
+
+            # Find potential join keys
+            key_patterns = ["PIN", "PARCEL", "ACCOUNT", "ID"]
+            potential_keys = [
+                f for f in fields
+                if any(k in f.upper() for k in key_patterns)
+            ]
+
+            # Get sample values from the first record's key columns only
+            first = pyogrio.read_dataframe(
+                str(path),
+                layer=layer,
+                columns=potential_keys,
+                read_geometry=False,
+                max_features=1,
+            )
+            rec = first.iloc[0].to_dict() if len(first) else {}
+            samples = {key: rec.get(key) for key in potential_keys}
+
+            results[name] = {
+                "potential_keys": potential_keys,
+                "sample_values": samples,
+                "record_count": record_count,
+            }
+
+            print(f"  Record count: {record_count:,}")
+            print(f"  Potential join columns: {potential_keys}")
+            print("  Sample values:")
+            for key, val in samples.items():
+                print(f"    {key}: {val!r}")
 
         print("\n" + "=" * 70)
         print("RECOMMENDED JOIN STRATEGY:")
@@ -201,16 +231,99 @@ class PropertyDataIntegrator:
             DataFrame with standardized parcel_id column.
         """
         if source_col in df.columns:
-            # Ensure string type and strip whitespace
-            df["parcel_id"] = df[source_col].astype(str).str.strip()
+            parcel_ids = df[source_col].astype(PARCEL_ID_DTYPE)
 
-            # Ensure leading zero for consistency (13-digit format)
-            df["parcel_id"] = df["parcel_id"].apply(
-                lambda x: x.zfill(13) if x and len(x) < 13 else x
-            )
+            # Fast path: IDs that are already 13 digits would come through
+            # strip and zfill unchanged. Check a sample first so layers with
+            # unpadded IDs don't pay for a full scan before the slow path
+            if (
+                self._is_clean_parcel_id(parcel_ids.head(1024))
+                and self._is_clean_parcel_id(parcel_ids)
+            ):
+                df["parcel_id"] = parcel_ids
+                return df
+
+            # Strip whitespace
+            parcel_ids = parcel_ids.str.strip()
+
+            # Ensure leading zero for consistency (13-digit format). zfill is a
+            # no-op for IDs of 13+ characters; empty and missing IDs are kept.
+            df["parcel_id"] = parcel_ids.str.zfill(13).where(parcel_ids.str.len() != 0, parcel_ids)
 
         return df
 
+    @staticmethod
+    def _is_clean_parcel_id(parcel_ids: pd.Series) -> bool:
+        """Check that every non-missing ID is exactly 13 digits."""
+        return bool(
+            (parcel_ids.str.len() == 13).all() and parcel_ids.str.isdigit().all()
+        )
+
+    @staticmethod
+    def _left_join_unique(
+        left: pd.DataFrame,
+        right: pd.DataFrame,
+        key: str,
+    ) -> pd.DataFrame:
+        """
+        Left-join a frame that has one row per key onto another.
+
+        A single hash lookup of the left keys into the right frame's index
+        replaces the merge machinery. Right frames with duplicate keys, or
+        with non-key columns the left frame already has, fall back to a
+        regular merge so rows multiply and shared columns get _x/_y
+        suffixes exactly as before.
+
+        Args:
+            left: Frame to add columns to (e.g. parcels).
+            right: Frame with the columns to add, keyed by key.
+            key: Join column present in both frames.
+
+        Returns:
+            Left frame, in its original row order and with a fresh RangeIndex
+            like merge returns, with the right columns added.
+        """
+        shared = right.columns.difference([key]).intersection(left.columns)
+        if not right[key].is_unique or len(shared):
+            return left.merge(right, on=key, how="left")
+
+        aligned = right.set_index(key).reindex(left[key].array)
+        aligned.index = left.index
+        joined = left.assign(**{col: aligned[col] for col in aligned.columns})
+        return joined.reset_index(drop=True)
+
+    def _merge_cache_path(self, boundary: Optional[BoundingBox]) -> Optional[Path]:
+        """
+        Get the cache file for a merged property frame.
+
+        The file name is a hash of the boundary and the modification times
+        of the parcels geodatabase, so edited source data or a different
+        area never hits a stale cache.
+
+        Args:
+            boundary: Bounding box the frame was loaded for, or None.
+
+        Returns:
+            Path to the GeoParquet cache file, or None if caching is off.
+        """
+        if self.cache_dir is None or not _PYARROW_AVAILABLE:
+            return None
+
+        gdb_path = Path(self.loader.parcels_gdb_path)
+        if not gdb_path.exists():
+            return None
+        source_files = sorted(gdb_path.rglob("*")) if gdb_path.is_dir() else [gdb_path]
+        source_mtimes = [(f.name, f.stat().st_mtime_ns) for f in source_files]
+
+        bounds = (
+            (boundary.min_x, boundary.min_y, boundary.max_x, boundary.max_y)
+            if boundary
+            else None
+        )
+        key = repr((MERGE_CACHE_VERSION, str(gdb_path.resolve()), bounds, source_mtimes))
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return Path(self.cache_dir) / f"merged_property_data_{digest}.parquet"
+
     def load_and_merge_property_data(
         self,
         boundary: Optional[BoundingBox] = None,
@@ -220,6 +333,8 @@ class PropertyDataIntegrator:
 
         This performs a tabular merge (not spatial) using parcel_id as the
         join key. Does not include building footprints (use spatial_join_buildings).
+        With a cache_dir set, the result is cached as GeoParquet and re-read
+        on later calls for the same boundary and unchanged source data.
 
         Args:
             boundary: Optional bounding box to filter parcels spatially.
@@ -227,6 +342,16 @@ class PropertyDataIntegrator:
         Returns:
             GeoDataFrame with parcels merged with values and improvements.
         """
+        cache_path = self._merge_cache_path(boundary)
+        if cache_path is not None and cache_path.exists():
+            merged = gpd.read_parquet(cache_path)
+            logger.info(
+                "Loaded merged property data from cache %s (%d records)",
+                cache_path,
+                len(merged),
+            )
+            return merged
+
         logger.info("Loading and merging property data...")
 
         # 1. Load parcels (with geometry)
@@ -245,7 +370,9 @@ class PropertyDataIntegrator:
         parcels = self._standardize_parcel_id(parcels, "PARCELNB")
 
         # 2. Load property values
-        values = self.loader.load_property_values(standardize_fields=False)
+        values = self.loader.load_property_values(
+            standardize_fields=False, columns=list(VALUES_COLUMNS)
+        )
         logger.info("Loaded %d property value records", len(values))
 
         # Rename columns (exclude parcelnb - we'll standardize it separately)
@@ -273,7 +400,9 @@ class PropertyDataIntegrator:
         values = values[value_cols].drop_duplicates(subset=["parcel_id"])
 
         # 3. Load property improvements
-        improvements = self.loader.load_property_improvements(standardize_fields=False)
+        improvements = self.loader.load_property_improvements(
+            standardize_fields=False, columns=list(IMPROVEMENTS_COLUMNS)
+        )
         logger.info("Loaded %d improvement records", len(improvements))
 
         # Rename columns first (before adding parcel_id)
@@ -287,39 +416,37 @@ class PropertyDataIntegrator:
         improvements = self._standardize_parcel_id(improvements, "parcelnb")
 
         # Aggregate improvements per parcel (there can be multiple buildings)
+        # in one grouped pass, counting buildings alongside the other stats
         agg_cols = {}
         if "building_sqft" in improvements.columns:
-            agg_cols["building_sqft"] = "sum"
+            agg_cols["total_building_sqft"] = ("building_sqft", "sum")
         if "year_built" in improvements.columns:
-            agg_cols["year_built"] = "min"  # Oldest building
+            agg_cols["oldest_year_built"] = ("year_built", "min")  # Oldest building
         if "property_type" in improvements.columns:
-            agg_cols["property_type"] = "first"
+            agg_cols["property_type"] = ("property_type", "first")
         if "building_description" in improvements.columns:
-            agg_cols["building_description"] = "first"
+            agg_cols["building_description"] = ("building_description", "first")
         if "rooms" in improvements.columns:
-            agg_cols["rooms"] = "sum"
+            agg_cols["rooms"] = ("rooms", "sum")
         if "bedrooms" in improvements.columns:
-            agg_cols["bedrooms"] = "sum"
+            agg_cols["bedrooms"] = ("bedrooms", "sum")
         if "bathrooms" in improvements.columns:
-            agg_cols["bathrooms"] = "sum"
-
-        imp_agg = improvements.groupby("parcel_id").agg(agg_cols).reset_index()
-
-        imp_agg = imp_agg.rename(columns={
-            "building_sqft": "total_building_sqft",
-            "year_built": "oldest_year_built",
-        })
-
-        # Count buildings per parcel
-        imp_counts = improvements.groupby("parcel_id").size().reset_index(name="improvement_count")
-        imp_agg = imp_agg.merge(imp_counts, on="parcel_id", how="left")
+            agg_cols["bathrooms"] = ("bathrooms", "sum")
+        agg_cols["improvement_count"] = ("parcel_id", "size")
+
+        # Group keys needn't be sorted; the result is joined back by key
+        imp_agg = (
+            improvements.groupby("parcel_id", sort=False)
+            .agg(**agg_cols)
+            .reset_index()
+        )
 
         # 4. Merge datasets
         logger.info("Merging parcels with values...")
-        merged = parcels.merge(values, on="parcel_id", how="left")
+        merged = self._left_join_unique(parcels, values, "parcel_id")
 
         logger.info("Merging with improvements...")
-        merged = merged.merge(imp_agg, on="parcel_id", how="left")
+        merged = self._left_join_unique(merged, imp_agg, "parcel_id")
 
         logger.info(
             "Merged dataset: %d records, %d columns",
@@ -327,34 +454,49 @@ class PropertyDataIntegrator:
             len(merged.columns),
         )
 
+        if cache_path is not None:
+            # The cache only saves time; a failed write must not fail the load
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                merged.to_parquet(cache_path, compression="snappy")
+                logger.info("Cached merged property data to %s", cache_path)
+            except Exception as e:
+                logger.warning("Could not cache merged property data: %s", e)
+
         return merged
 
     def load_latest_sales(
         self,
-        parcel_ids: Optional[list[str]] = None,
+        parcel_ids: Optional[Union[pd.Index, list[str]]] = None,
     ) -> pd.DataFrame:
         """
         Load the most recent sale for each parcel.
 
         Args:
-            parcel_ids: Optional list of parcel IDs to filter.
+            parcel_ids: Optional parcel IDs to filter, ideally a unique
+                pd.Index so the filter reuses its hash table.
 
         Returns:
             DataFrame with one row per parcel showing latest sale info.
         """
         logger.info("Loading sales data...")
 
-        # Load all sales
-        import fiona
-
-        records = []
-        with fiona.open(
-            str(self.loader.parcels_gdb_path), layer="PropertySales"
-        ) as src:
-            for rec in src:
-                records.append(rec["properties"])
+        if parcel_ids is not None:
+            parcel_ids = pd.Index(parcel_ids)
+
+        # Read only the mapped columns straight into a DataFrame (no
+        # per-record Python dicts). Filter by parcel after standardization,
+        # not in an OGR where clause: raw parcelnb values may be padded with
+        # whitespace, which OGR SQL cannot trim, and IN lists on the
+        # unindexed field are slower than one full read
+        sales = pyogrio.read_dataframe(
+            str(self.loader.parcels_gdb_path),
+            layer="PropertySales",
+            columns=list(SALES_COLUMNS),
+            read_geometry=False,
+            use_arrow=_PYARROW_AVAILABLE,
+        )
 
-        sales = pd.DataFrame(records)
         sales = self._standardize_parcel_id(sales, "parcelnb")
 
         # Rename columns (exclude parcelnb - already standardized to parcel_id)
@@ -367,7 +509,7 @@ class PropertyDataIntegrator:
         logger.info("Loaded %d sales records", len(sales))
 
         # Filter to specific parcels if provided
-        if parcel_ids:
+        if parcel_ids is not None and len(parcel_ids):
             sales = sales[sales["parcel_id"].isin(parcel_ids)]
             logger.info("Filtered to %d sales for specified parcels", len(sales))
 
@@ -375,10 +517,21 @@ class PropertyDataIntegrator:
         if "sale_date" in sales.columns:
             sales["sale_date"] = pd.to_datetime(sales["sale_date"], errors="coerce")
 
-        # Get most recent sale per parcel
+        # Get most recent sale per parcel with a hashed idxmax rather than a
+        # full sort. Parcels whose sales all have bad dates still keep their
+        # first undated sale record
         if "sale_date" in sales.columns:
-            sales = sales.sort_values("sale_date", ascending=False)
-            latest_sales = sales.groupby("parcel_id").first().reset_index()
+            undated = sales["sale_date"].isna()
+            dated_sales = sales[~undated]
+            latest_idx = dated_sales.groupby("parcel_id")["sale_date"].idxmax()
+            undated_only = sales[
+                undated
+                & sales["parcel_id"].notna()
+                & ~sales["parcel_id"].isin(latest_idx.index)
+            ].drop_duplicates(subset=["parcel_id"])
+            latest_sales = pd.concat(
+                [sales.loc[latest_idx], undated_only], ignore_index=True
+            )
         else:
             latest_sales = sales.drop_duplicates(subset=["parcel_id"])
 
@@ -440,41 +593,49 @@ class PropertyDataIntegrator:
         if parcels_gdf.crs != buildings_gdf.crs:
             buildings_gdf = buildings_gdf.to_crs(parcels_gdf.crs)
 
-        # Calculate building footprint areas (in square feet)
-        # Project to meters CRS for accurate area calculation
-        buildings_projected = buildings_gdf.to_crs("EPSG:26913")
-        buildings_gdf["footprint_area_sqm"] = buildings_projected.geometry.area
-        buildings_gdf["footprint_area_sqft"] = buildings_gdf["footprint_area_sqm"] * 10.764
-
-        # Spatial join - find which parcel each building belongs to
-        buildings_with_parcel = gpd.sjoin(
-            buildings_gdf,
-            parcels_gdf[["parcel_id", "geometry"]],
-            how="left",
-            predicate="within",
+        # Calculate building footprint and parcel areas (in square feet)
+        buildings_gdf["footprint_area_sqft"] = self._area_sqft(buildings_gdf.geometry)
+        parcel_area_sqft = self._area_sqft(parcels_gdf.geometry)
+
+        # Spatial join - find which parcel each building belongs to by querying
+        # the parcels' own spatial index. The index is cached on the parcels
+        # frame, so repeat joins against the same parcels don't rebuild it.
+        # "intersects" keeps footprints that straddle a parcel line (common
+        # with sub-meter alignment errors) which "within" would drop
+        building_idx, parcel_idx = self._query_tree(
+            parcels_gdf.sindex, buildings_gdf.geometry.to_numpy(), "intersects"
+        )
+        building_idx, parcel_idx = self._assign_to_largest_overlap(
+            buildings_gdf.geometry.to_numpy(),
+            parcels_gdf.geometry.to_numpy(),
+            building_idx,
+            parcel_idx,
         )
 
-        # Aggregate building stats per parcel
-        building_stats = buildings_with_parcel.groupby("parcel_id").agg({
-            "footprint_area_sqft": ["count", "sum"],
-        }).reset_index()
-
-        building_stats.columns = [
-            "parcel_id",
-            "building_footprint_count",
-            "building_footprint_sqft",
-        ]
-
-        # Merge back to parcels
-        result = parcels_gdf.merge(building_stats, on="parcel_id", how="left")
+        # Aggregate building stats per parcel ID on integer codes rather than
+        # hashing ID strings; parcels sharing an ID share their buildings,
+        # as a merge on parcel_id would
+        parcel_codes, parcel_id_values = pd.factorize(parcels_gdf["parcel_id"])
+        building_codes = parcel_codes[parcel_idx]
+        footprint_sqft = buildings_gdf["footprint_area_sqft"].to_numpy()[building_idx]
+        counted = (building_codes >= 0) & ~np.isnan(footprint_sqft)
+        # One extra trailing slot stays zero for parcels without an ID (code -1)
+        n_slots = len(parcel_id_values) + 1
+        id_counts = np.bincount(building_codes[counted], minlength=n_slots)
+        id_sqft = np.bincount(
+            building_codes[counted],
+            weights=footprint_sqft[counted],
+            minlength=n_slots,
+        )
 
-        # Fill NaN with 0 for parcels without buildings
-        result["building_footprint_count"] = result["building_footprint_count"].fillna(0).astype(int)
-        result["building_footprint_sqft"] = result["building_footprint_sqft"].fillna(0.0)
+        result = parcels_gdf.assign(
+            building_footprint_count=id_counts[parcel_codes],
+            building_footprint_sqft=id_sqft[parcel_codes],
+        )
 
-        # Calculate parcel area and coverage percentage
-        parcels_projected = result.to_crs("EPSG:26913")
-        result["parcel_area_sqft"] = parcels_projected.geometry.area * 10.764
+        # Parcel row order is unchanged, so the areas computed up front line
+        # up row for row
+        result["parcel_area_sqft"] = parcel_area_sqft
 
         result["building_coverage_pct"] = np.where(
             result["parcel_area_sqft"] > 0,
@@ -490,6 +651,150 @@ class PropertyDataIntegrator:
 
         return result
 
+    @staticmethod
+    def _area_sqft(geometry: gpd.GeoSeries) -> np.ndarray:
+        """
+        Calculate geometry areas in square feet without reprojecting vertices.
+
+        Projected CRSs are scaled by their linear unit. For geographic
+        coordinates each area in square degrees is scaled by the WGS84
+        meters-per-degree at the geometry's mid-latitude; this agrees with
+        UTM Zone 13N areas to within 0.1%, most of which is UTM's own scale
+        distortion. Any other CRS goes through a full to_crs reprojection.
+
+        Args:
+            geometry: Geometries to measure.
+
+        Returns:
+            Array of areas in square feet.
+        """
+        crs = geometry.crs
+        areas = shapely.area(geometry.to_numpy())
+
+        if crs is not None and crs.is_projected:
+            meters_per_unit = crs.axis_info[0].unit_conversion_factor
+            return areas * meters_per_unit ** 2 * 10.764
+
+        if crs is not None and crs.is_geographic:
+            bounds = shapely.bounds(geometry.to_numpy())
+            lat = np.radians((bounds[:, 1] + bounds[:, 3]) / 2)
+            meters_per_deg_lat = 111132.92 - 559.82 * np.cos(2 * lat) + 1.175 * np.cos(4 * lat)
+            meters_per_deg_lon = 111412.84 * np.cos(lat) - 93.5 * np.cos(3 * lat)
+            return areas * meters_per_deg_lat * meters_per_deg_lon * 10.764
+
+        return geometry.to_crs("EPSG:26913").area.to_numpy() * 10.764
+
+    @staticmethod
+    def _query_tree(
+        sindex: Any,
+        geoms: np.ndarray,
+        predicate: str,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Query a spatial index, splitting large inputs across threads.
+
+        Inputs of PARALLEL_QUERY_MIN_FEATURES or more geometries are queried
+        in one contiguous chunk per CPU; GEOS releases the GIL while
+        querying, so the chunks run in parallel. Results come back in the
+        same order as a single query.
+
+        Args:
+            sindex: Spatial index of the tree geometries (e.g. gdf.sindex).
+            geoms: Input geometries to query with.
+            predicate: Spatial predicate evaluated as predicate(input, tree).
+
+        Returns:
+            Tuple of (input positions, tree positions) for matching pairs.
+        """
+        n_workers = os.cpu_count() or 1
+        if len(geoms) < PARALLEL_QUERY_MIN_FEATURES or n_workers == 1:
+            pairs = sindex.query(geoms, predicate=predicate)
+        else:
+            def query_chunk(positions: np.ndarray) -> np.ndarray:
+                chunk_pairs = sindex.query(geoms[positions], predicate=predicate)
+                chunk_pairs[0] = positions[chunk_pairs[0]]
+                return chunk_pairs
+
+            chunks = np.array_split(np.arange(len(geoms)), n_workers)
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                pairs = np.concatenate(list(executor.map(query_chunk, chunks)), axis=1)
+
+        return pairs[0], pairs[1]
+
+    @staticmethod
+    def _assign_to_largest_overlap(
+        building_geoms: np.ndarray,
+        parcel_geoms: np.ndarray,
+        building_idx: np.ndarray,
+        parcel_idx: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Reduce building/parcel intersect pairs to one parcel per building.
+
+        Buildings that hit a single parcel are kept as is; only buildings
+        matching several parcels pay for the intersection-area test and go
+        to the parcel they overlap most.
+
+        Args:
+            building_geoms: Building geometries, indexed by building_idx.
+            parcel_geoms: Parcel geometries, indexed by parcel_idx.
+            building_idx: Building positions of the candidate pairs.
+            parcel_idx: Parcel positions of the candidate pairs.
+
+        Returns:
+            Tuple of (building_idx, parcel_idx) with one pair per building.
+        """
+        match_counts = np.bincount(building_idx, minlength=len(building_geoms))
+        ambiguous = match_counts[building_idx] > 1
+        if not ambiguous.any():
+            return building_idx, parcel_idx
+
+        overlap = np.zeros(len(building_idx))
+        overlap[ambiguous] = shapely.area(shapely.intersection(
+            building_geoms[building_idx[ambiguous]],
+            parcel_geoms[parcel_idx[ambiguous]],
+        ))
+
+        # Order pairs by building, largest overlap first, and keep the first
+        order = np.lexsort((-overlap, building_idx))
+        sorted_buildings = building_idx[order]
+        first = np.r_[True, sorted_buildings[1:] != sorted_buildings[:-1]]
+        keep = order[first]
+        return building_idx[keep], parcel_idx[keep]
+
+    @staticmethod
+    def _first_containing_zone(points: np.ndarray, zone_geoms: np.ndarray) -> np.ndarray:
+        """
+        Find the first zone polygon containing each point.
+
+        Candidate zone/point pairs come from one bounding-box query of a
+        point R-tree; only those pairs get an exact containment test, run on
+        raw x/y coordinates against prepared polygons. Points on a zone
+        boundary count as outside, as with a "within" join.
+
+        Args:
+            points: Point geometries to look up.
+            zone_geoms: Zone polygons.
+
+        Returns:
+            Position of the lowest-numbered containing zone for each point,
+            or -1 where no zone contains it.
+        """
+        zone_idx, point_idx = shapely.STRtree(points).query(zone_geoms)
+
+        shapely.prepare(zone_geoms)
+        inside = shapely.contains_xy(
+            zone_geoms[zone_idx],
+            shapely.get_x(points)[point_idx],
+            shapely.get_y(points)[point_idx],
+        )
+
+        # Zones overlap at most occasionally; keep the lowest zone position
+        n_zones = len(zone_geoms)
+        first_zone = np.full(len(points), n_zones)
+        np.minimum.at(first_zone, point_idx[inside], zone_idx[inside])
+        return np.where(first_zone < n_zones, first_zone, -1)
+
     def spatial_join_zoning(
         self,
         parcels_gdf: gpd.GeoDataFrame,
@@ -535,29 +840,23 @@ class PropertyDataIntegrator:
         if parcels_gdf.crs != zoning_gdf.crs:
             zoning_gdf = zoning_gdf.to_crs(parcels_gdf.crs)
 
-        # Create parcel centroids for point-in-polygon join
-        parcels_centroids = parcels_gdf.copy()
-        parcels_centroids["centroid_geom"] = parcels_centroids.geometry.centroid
-        parcels_centroids = parcels_centroids.set_geometry("centroid_geom")
+        # Point-in-polygon zone lookup on parcel points. A representative
+        # point is cheaper than the true centroid and always lies inside the
+        # parcel, even for L-shaped or concave lots
+        points = shapely.point_on_surface(parcels_gdf.geometry.to_numpy())
+        zone_pos = self._first_containing_zone(points, zoning_gdf.geometry.to_numpy())
 
-        # Spatial join - find which zone each parcel centroid falls into
-        zoning_cols = ["zoning_code", "zoning_jurisdiction", "geometry"]
+        zoning_cols = ["zoning_code", "zoning_jurisdiction"]
         zoning_cols = [c for c in zoning_cols if c in zoning_gdf.columns]
 
-        parcels_with_zoning = gpd.sjoin(
-            parcels_centroids,
-            zoning_gdf[zoning_cols],
-            how="left",
-            predicate="within",
-        )
+        parcels_with_zoning = parcels_gdf.assign(**{
+            col: zoning_gdf[col].array.take(zone_pos, allow_fill=True)
+            for col in zoning_cols
+        })
 
-        # Handle duplicates (parcel centroid on zone boundary - take first)
+        # One row per parcel ID, as the full-frame join produced
         parcels_with_zoning = parcels_with_zoning.drop_duplicates(subset=["parcel_id"])
 
-        # Restore original geometry
-        parcels_with_zoning = parcels_with_zoning.set_geometry("geometry")
-        parcels_with_zoning = parcels_with_zoning.drop(columns=["centroid_geom", "index_right"], errors="ignore")
-
         # Count parcels with zoning
         has_zoning = parcels_with_zoning["zoning_code"].notna().sum()
         logger.info(
@@ -615,7 +914,7 @@ class PropertyDataIntegrator:
 
         # Step 2: Add latest sales if requested
         if include_sales:
-            parcel_ids = unified["parcel_id"].unique().tolist()
+            parcel_ids = pd.Index(unified["parcel_id"].unique())
             sales = self.load_latest_sales(parcel_ids)
             unified = unified.merge(sales, on="parcel_id", how="left")
             logger.info("Added sales data for %d parcels", sales["parcel_id"].nunique())
@@ -628,12 +927,20 @@ class PropertyDataIntegrator:
         if include_zoning:
             unified = self.spatial_join_zoning(unified, boundary=boundary)
 
-        # Step 5: Clean up and reorder columns
+        # Step 5: Cache WGS84 parcel centroids so downstream exporters
+        # (map, Excel map data) can use them without recomputing
+        centroids = shapely.centroid(unified.geometry.values)
+        unified["centroid_lat"] = shapely.get_y(centroids)
+        unified["centroid_lon"] = shapely.get_x(centroids)
+
+        # Step 6: Clean up and reorder columns
         # Put key columns first
         key_cols = [
             "parcel_id",
             "pin",
             "geometry",
+            "centroid_lat",
+            "centroid_lon",
         ]
 
         # Address columns
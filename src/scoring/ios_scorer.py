@@ -14,9 +14,11 @@ properties for IOS suitability. The scoring dimensions are:
 Scores are configurable via config/scoring_weights.yaml.
 """
 
+import json
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -30,6 +32,23 @@ logger = logging.getLogger(__name__)
 # Conversion constants
 SQFT_PER_ACRE = 43560
 
+# Candidate zoning columns in priority order
+ZONING_CODE_COLUMNS = ("zoning_code", "zoning", "zone", "ZONE", "ZONING")
+ZONING_DESC_COLUMNS = ("zoning_desc", "zoning_description", "ZONE_DESC")
+
+# Text columns searched for land use keywords, in the order they are joined
+LAND_USE_TEXT_COLUMNS = (
+    "land_use",
+    "land_use_desc",
+    "property_type",
+    "building_description",
+    "occupancy_description",
+    "use_code",
+    "use_desc",
+    "proptype",
+    "bltasdesc",
+)
+
 
 @dataclass
 class ScoreResult:
@@ -105,22 +124,206 @@ class IOSScorer:
         self.config = self._load_config()
         self.weights = self.config.get("weights", {})
 
+        # Weights in component order, for scoring whole datasets at once
+        self._weights_vec = np.array(
+            [
+                self.weights.get("parcel_size", 0.25),
+                self.weights.get("building_coverage", 0.30),
+                self.weights.get("zoning", 0.20),
+                self.weights.get("land_use", 0.15),
+                self.weights.get("structural", 0.05),
+                self.weights.get("location", 0.05),
+            ],
+            dtype=float,
+        )
+
+        self._build_threshold_tables()
+        self._build_zoning_lookup()
+        self._build_land_use_lookup()
+
+        # Composite scores repeat across parcels, so tier lookups are memoized
+        self._confidence_tiers = [
+            (
+                tier.get("min", 0),
+                tier.get("max", 100),
+                tier.get("grade", "?"),
+                tier.get("label", "Unknown"),
+            )
+            for tier in self.config.get("classification", {}).get("tiers", [])
+        ]
+        self._classify_cached = lru_cache(maxsize=1024)(self._classify_uncached)
+
         logger.info("Initialized IOSScorer")
         logger.info("  Config: %s", self.config_path)
         logger.info("  Weights: %s", self.weights)
 
     def _load_config(self) -> dict[str, Any]:
-        """Load scoring configuration from YAML file."""
+        """
+        Load scoring configuration from YAML file.
+
+        The parsed config is cached as JSON next to the YAML file and
+        reused while the YAML file's mtime is unchanged.
+        """
         if not self.config_path.exists():
             logger.warning("Config not found at %s, using defaults", self.config_path)
             return self._get_default_config()
 
+        mtime_ns = self.config_path.stat().st_mtime_ns
+        cache_path = self.config_path.with_suffix(self.config_path.suffix + ".json")
+        if cache_path.exists():
+            try:
+                with open(cache_path, "r") as f:
+                    cached = json.load(f)
+                if cached.get("mtime_ns") == mtime_ns:
+                    logger.info("Loaded scoring config from cache %s", cache_path)
+                    return cached["config"]
+            except Exception as e:
+                logger.warning("Ignoring unreadable config cache %s: %s", cache_path, e)
+
         with open(self.config_path, "r") as f:
             config = yaml.safe_load(f)
 
+        # The cache only saves time; a failed write must not fail the load.
+        # Configs that don't survive a JSON round trip (e.g. non-string
+        # keys) are not cached.
+        try:
+            payload = json.dumps({"mtime_ns": mtime_ns, "config": config})
+            if json.loads(payload)["config"] == config:
+                with open(cache_path, "w") as f:
+                    f.write(payload)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not cache scoring config: %s", e)
+
         logger.info("Loaded scoring config from %s", self.config_path)
         return config
 
+    @staticmethod
+    def _threshold_table(
+        thresholds: list[dict[str, Any]], key: str, value_key: str, default_value: float = 0
+    ) -> tuple[tuple[Optional[float], float, str], ...]:
+        """
+        Flatten config threshold dicts into (upper bound, value, label) tuples.
+
+        Args:
+            thresholds: Threshold dicts from the scoring config.
+            key: Name of the upper-bound key (None means no upper limit).
+            value_key: Name of the score or adjustment key.
+            default_value: Value used when value_key is missing.
+
+        Returns:
+            Tuple of (upper bound, value, label) tuples in config order.
+        """
+        return tuple(
+            (t.get(key), t.get(value_key, default_value), t.get("label", ""))
+            for t in thresholds
+        )
+
+    def _build_threshold_tables(self) -> None:
+        """
+        Resolve the per-dimension config slices used while scoring.
+
+        Scoring methods read these instead of walking the YAML dicts on
+        every call.
+        """
+        self._parcel_size_thresholds = self._threshold_table(
+            self.config.get("parcel_size", {}).get("thresholds", []), "max", "score"
+        )
+        self._coverage_thresholds = self._threshold_table(
+            self.config.get("building_coverage", {}).get("thresholds", []), "max", "score"
+        )
+
+        structural_config = self.config.get("structural", {})
+        self._structural_base_score = structural_config.get("base_score", 50)
+        self._building_count_thresholds = self._threshold_table(
+            structural_config.get("building_count", []), "count", "adjustment"
+        )
+        self._building_size_thresholds = self._threshold_table(
+            structural_config.get("building_size", []), "max", "adjustment"
+        )
+
+        self._zoning_default_score = self.config.get("zoning", {}).get("default_score", 40)
+        self._land_use_default_score = self.config.get("land_use", {}).get("default_score", 50)
+        self._location_config = self.config.get("location", {})
+
+    def _build_zoning_lookup(self) -> None:
+        """
+        Precompute zoning match tables from the config.
+
+        Code categories and low-value patterns both match on equality or
+        prefix, so they share one dict of uppercase code -> (priority, score,
+        description). A zoning code is then resolved by looking up each of its
+        prefixes and keeping the lowest priority, which reproduces the
+        category-then-list order of the config.
+        """
+        zoning_config = self.config.get("zoning", {})
+
+        # Zone categories in priority order, then the low-value patterns
+        zone_categories = [
+            ("high_value", "codes", 40, "industrial (score 100)"),
+            ("medium_high", "codes", 40, "heavy commercial (score 75)"),
+            ("moderate", "codes", 40, "highway commercial (score 65)"),
+            ("medium", "codes", 40, "agricultural/general commercial (score 55)"),
+            ("pud", "codes", 40, "planned development (score 50)"),
+            ("low_medium", "codes", 40, "office/community commercial (score 40)"),
+            ("low_value", "patterns", 10, "residential/low-value, score 10"),
+        ]
+
+        self._zoning_prefixes: dict[str, tuple[int, float, str]] = {}
+        priority = 0
+        for category, list_type, default_score, description in zone_categories:
+            category_config = zoning_config.get(category, {})
+            score = category_config.get("score", default_score)
+            for code in category_config.get(list_type, []):
+                self._zoning_prefixes.setdefault(
+                    str(code).upper(), (priority, score, description)
+                )
+                priority += 1
+
+        city_placeholders = zoning_config.get("city_placeholders", {})
+        self._zoning_placeholders = (
+            city_placeholders.get("score", 40),
+            [str(pattern).upper() for pattern in city_placeholders.get("patterns", [])],
+        )
+
+        self._zoning_bonus: list[tuple[str, float]] = []
+        for kw in zoning_config.get("bonus_keywords", []):
+            pattern = kw.get("pattern", "").lower()
+            if pattern:
+                self._zoning_bonus.append((pattern, kw.get("bonus", 0)))
+
+        # One regex pass rules out descriptions without any bonus keyword
+        self._zoning_bonus_re = (
+            re.compile("|".join(re.escape(pattern) for pattern, _ in self._zoning_bonus))
+            if self._zoning_bonus
+            else None
+        )
+
+    def _build_land_use_lookup(self) -> None:
+        """
+        Precompute land use keyword tiers from the config.
+
+        Each tier holds lowercase (pattern, score) pairs sorted by score,
+        highest first, with config order kept among equal scores. The first
+        pattern found in the text is then the same one the in-order scan for
+        the highest score would pick, and the scan can stop as soon as scores
+        drop to the current best.
+        """
+        land_use_config = self.config.get("land_use", {})
+
+        self._land_use_tiers: dict[str, list[tuple[str, float]]] = {}
+        for tier, default_score in (
+            ("high_value_keywords", 100),
+            ("moderate_keywords", 60),
+            ("property_types", 50),
+        ):
+            entries = []
+            for kw in land_use_config.get(tier, []):
+                pattern = kw.get("pattern", "").lower()
+                if pattern:
+                    entries.append((pattern, kw.get("score", default_score)))
+            entries.sort(key=lambda entry: entry[1], reverse=True)
+            self._land_use_tiers[tier] = entries
+
     def _get_default_config(self) -> dict[str, Any]:
         """Return default configuration if YAML not found."""
         return {
@@ -143,19 +346,118 @@ class IOSScorer:
             },
         }
 
-    def _get_value(self, row: pd.Series, *columns: str) -> Any:
+    def _get_value(self, row: tuple, col_idx: dict[str, int], *columns: str) -> Any:
         """Get first available value from multiple possible column names."""
         for col in columns:
-            if col in row.index and pd.notna(row[col]):
-                return row[col]
+            pos = col_idx.get(col)
+            if pos is not None and pd.notna(row[pos]):
+                return row[pos]
         return None
 
-    def _score_parcel_size(self, row: pd.Series) -> tuple[float, list[str]]:
+    def _first_available(self, gdf: pd.DataFrame, *columns: str) -> np.ndarray:
+        """
+        Get the first available numeric value per row across column names.
+
+        Vectorized counterpart of _get_value for numeric columns; missing
+        columns are skipped and rows with no value are NaN.
+
+        Args:
+            gdf: Parcels being scored.
+            *columns: Candidate column names in priority order.
+
+        Returns:
+            Float array with one value per row.
+        """
+        values = np.full(len(gdf), np.nan)
+        for col in columns:
+            if col in gdf.columns:
+                missing = np.isnan(values)
+                column = gdf[col].to_numpy(dtype=float, na_value=np.nan)
+                values[missing] = column[missing]
+        return values
+
+    @staticmethod
+    def _first_threshold_index(
+        values: np.ndarray,
+        thresholds: tuple[tuple[Optional[float], float, str], ...],
+    ) -> np.ndarray:
+        """
+        Find the first threshold each value falls within, in config order.
+
+        Matches the row-wise loops: a threshold matches when its upper bound
+        is None or the value is <= it, and the first match wins. Thresholds
+        shadowed by an earlier, looser one can never match first and are
+        skipped, so the remaining caps are increasing and np.searchsorted
+        applies.
+
+        Args:
+            values: Values to classify.
+            thresholds: (upper bound, value, label) tuples from _threshold_table.
+
+        Returns:
+            Index into thresholds per value, or len(thresholds) where no
+            threshold matches (including NaN values).
+        """
+        caps: list[float] = []
+        positions: list[int] = []
+        for i, (cap, _, _) in enumerate(thresholds):
+            cap = np.inf if cap is None else float(cap)
+            if caps and cap <= caps[-1]:
+                continue
+            caps.append(cap)
+            positions.append(i)
+            if cap == np.inf:
+                break
+        positions.append(len(thresholds))
+
+        idx = np.searchsorted(np.array(caps), values, side="left")
+        return np.array(positions)[idx]
+
+    def _score_parcel_size_vectorized(
+        self, gdf: pd.DataFrame, with_notes: bool = True
+    ) -> tuple[np.ndarray, Optional[list[list[str]]]]:
+        """
+        Score parcel acreage for every row at once.
+
+        Same rules as _score_parcel_size, applied to whole columns.
+
+        Args:
+            gdf: Parcels being scored.
+            with_notes: Whether to build the notes; skipped when not needed.
+
+        Returns:
+            Tuple of (score array, notes list per row or None).
+        """
+        area_sqft = self._first_available(gdf, "parcel_area_sqft", "lot_size", "Shape_Area")
+        has_area = area_sqft > 0
+
+        # Small numbers are assumed to already be acres
+        acres = np.where(area_sqft < 1000, area_sqft, area_sqft / SQFT_PER_ACRE)
+
+        thresholds = self._parcel_size_thresholds
+        idx = self._first_threshold_index(acres, thresholds)
+        threshold_scores = np.array([t[1] for t in thresholds] + [0])
+        labels = [t[2] for t in thresholds] + ["unknown"]
+
+        scores = np.where(has_area, threshold_scores[idx], 0)
+        if not with_notes:
+            return scores, None
+
+        notes = [
+            [f"Parcel size: {a:.2f} acres ({labels[i]})" if ok else "No parcel area data"]
+            for a, i, ok in zip(acres, idx, has_area)
+        ]
+        return scores, notes
+
+    def _score_parcel_size(
+        self, row: tuple, col_idx: dict[str, int]
+    ) -> tuple[float, list[str]]:
         """
         Score parcel based on acreage.
 
         Args:
-            row: DataFrame row with parcel data.
+            row: Parcel values, positioned per col_idx.
+            col_idx: Column name -> position in row.
 
         Returns:
             Tuple of (score, notes list).
@@ -165,6 +467,7 @@ class IOSScorer:
         # Get parcel area - try multiple sources
         area_sqft = self._get_value(
             row,
+            col_idx,
             "parcel_area_sqft",
             "lot_size",
             "Shape_Area",
@@ -183,23 +486,64 @@ class IOSScorer:
             acres = float(area_sqft) / SQFT_PER_ACRE
 
         # Score based on thresholds
-        thresholds = self.config.get("parcel_size", {}).get("thresholds", [])
-
         score = 0
         label = "unknown"
 
-        for threshold in thresholds:
-            max_val = threshold.get("max")
+        for max_val, threshold_score, threshold_label in self._parcel_size_thresholds:
             if max_val is None or acres <= max_val:
-                score = threshold.get("score", 0)
-                label = threshold.get("label", "")
+                score = threshold_score
+                label = threshold_label
                 break
 
         notes.append(f"Parcel size: {acres:.2f} acres ({label})")
 
         return score, notes
 
-    def _score_building_coverage(self, row: pd.Series) -> tuple[float, list[str]]:
+    def _score_building_coverage_vectorized(
+        self, gdf: pd.DataFrame, with_notes: bool = True
+    ) -> tuple[np.ndarray, Optional[list[list[str]]]]:
+        """
+        Score building coverage for every row at once.
+
+        Same rules as _score_building_coverage, applied to whole columns.
+
+        Args:
+            gdf: Parcels being scored.
+            with_notes: Whether to build the notes; skipped when not needed.
+
+        Returns:
+            Tuple of (score array, notes list per row or None).
+        """
+        coverage_pct = self._first_available(gdf, "building_coverage_pct")
+
+        # Fall back to footprint / parcel area where coverage is missing
+        footprint_sqft = self._first_available(gdf, "building_footprint_sqft")
+        parcel_sqft = self._first_available(gdf, "parcel_area_sqft", "Shape_Area")
+        missing = np.isnan(coverage_pct)
+        derivable = missing & ~np.isnan(footprint_sqft) & (parcel_sqft > 0)
+        coverage_pct[derivable] = footprint_sqft[derivable] / parcel_sqft[derivable] * 100
+        assumed = missing & ~derivable
+        coverage_pct[assumed] = 0
+
+        thresholds = self._coverage_thresholds
+        idx = self._first_threshold_index(coverage_pct, thresholds)
+        threshold_scores = np.array([t[1] for t in thresholds] + [0])
+        labels = [t[2] for t in thresholds] + ["unknown"]
+
+        scores = threshold_scores[idx]
+        if not with_notes:
+            return scores, None
+
+        notes = [
+            (["No building coverage data - assumed 0%"] if no_data else [])
+            + [f"Building coverage: {pct:.1f}% ({labels[i]})"]
+            for pct, i, no_data in zip(coverage_pct, idx, assumed)
+        ]
+        return scores, notes
+
+    def _score_building_coverage(
+        self, row: tuple, col_idx: dict[str, int]
+    ) -> tuple[float, list[str]]:
         """
         Score based on building coverage percentage.
 
@@ -207,7 +551,8 @@ class IOSScorer:
         5-15% coverage is optimal (some structures, mostly open land).
 
         Args:
-            row: DataFrame row with parcel data.
+            row: Parcel values, positioned per col_idx.
+            col_idx: Column name -> position in row.
 
         Returns:
             Tuple of (score, notes list).
@@ -217,13 +562,14 @@ class IOSScorer:
         # Get coverage percentage
         coverage_pct = self._get_value(
             row,
+            col_idx,
             "building_coverage_pct",
         )
 
         if coverage_pct is None:
             # Try to calculate from building footprint and parcel area
-            footprint_sqft = self._get_value(row, "building_footprint_sqft")
-            parcel_sqft = self._get_value(row, "parcel_area_sqft", "Shape_Area")
+            footprint_sqft = self._get_value(row, col_idx, "building_footprint_sqft")
+            parcel_sqft = self._get_value(row, col_idx, "parcel_area_sqft", "Shape_Area")
 
             if footprint_sqft is not None and parcel_sqft is not None and parcel_sqft > 0:
                 coverage_pct = (float(footprint_sqft) / float(parcel_sqft)) * 100
@@ -232,154 +578,219 @@ class IOSScorer:
                 notes.append("No building coverage data - assumed 0%")
 
         # Score based on thresholds (inverted - lower is better)
-        thresholds = self.config.get("building_coverage", {}).get("thresholds", [])
-
         score = 0
         label = "unknown"
 
-        for threshold in thresholds:
-            max_val = threshold.get("max")
+        for max_val, threshold_score, threshold_label in self._coverage_thresholds:
             if max_val is None or coverage_pct <= max_val:
-                score = threshold.get("score", 0)
-                label = threshold.get("label", "")
+                score = threshold_score
+                label = threshold_label
                 break
 
         notes.append(f"Building coverage: {coverage_pct:.1f}% ({label})")
 
         return score, notes
 
-    def _score_zoning(self, row: pd.Series) -> tuple[float, list[str]]:
+    def _first_available_values(self, gdf: pd.DataFrame, *columns: str) -> np.ndarray:
         """
-        Score based on zoning classification.
+        Get the first available value per row across column names.
+
+        Vectorized counterpart of _get_value for columns of any dtype.
 
         Args:
-            row: DataFrame row with parcel data.
+            gdf: Parcels being scored.
+            *columns: Candidate column names in priority order.
 
         Returns:
-            Tuple of (score, notes list).
+            Object array with one value per row, None where no column has one.
         """
-        notes = []
-        zoning_config = self.config.get("zoning", {})
+        values = np.full(len(gdf), None, dtype=object)
+        missing = np.ones(len(gdf), dtype=bool)
+        for col in columns:
+            if col in gdf.columns:
+                column = gdf[col]
+                take = missing & column.notna().to_numpy()
+                values[take] = column.to_numpy(dtype=object)[take]
+                missing &= ~take
+        return values
+
+    def _score_zoning_vectorized(
+        self, gdf: pd.DataFrame, with_notes: bool = True
+    ) -> tuple[np.ndarray, Optional[list[list[str]]]]:
+        """
+        Score zoning for every row at once.
 
-        # Get zoning code
-        zoning_code = self._get_value(
-            row,
-            "zoning_code",
-            "zoning",
-            "zone",
-            "ZONE",
-            "ZONING",
-        )
+        Parcels share a small set of zoning codes and descriptions, so each
+        distinct (code, description) pair is scored once with the same rules
+        as _score_zoning and the result is broadcast to its rows.
 
-        # Get zoning description
-        zoning_desc = self._get_value(
-            row,
-            "zoning_desc",
-            "zoning_description",
-            "ZONE_DESC",
-        )
+        Args:
+            gdf: Parcels being scored.
+            with_notes: Whether to build the notes; skipped when not needed.
 
-        if zoning_code is None:
-            notes.append("No zoning data available")
-            return zoning_config.get("default_score", 40), notes
+        Returns:
+            Tuple of (score array, notes list per row or None).
+        """
+        zoning_code = self._first_available_values(gdf, *ZONING_CODE_COLUMNS)
+        zoning_desc = self._first_available_values(gdf, *ZONING_DESC_COLUMNS)
+
+        code_keys, _ = pd.factorize(zoning_code, use_na_sentinel=False)
+        desc_keys, _ = pd.factorize(zoning_desc, use_na_sentinel=False)
+        pair_keys = code_keys.astype(np.int64) * (desc_keys.max(initial=-1) + 1) + desc_keys
+        _, first, inverse = np.unique(pair_keys, return_index=True, return_inverse=True)
+
+        results = [self._score_zoning_values(zoning_code[i], zoning_desc[i]) for i in first]
+        scores = np.array([score for score, _ in results])[inverse]
+        if not with_notes:
+            return scores, None
+        return scores, [results[k][1] for k in inverse]
+
+    def _score_zoning(
+        self, row: tuple, col_idx: dict[str, int]
+    ) -> tuple[float, list[str]]:
+        """
+        Score based on zoning classification.
 
-        zoning_code_upper = str(zoning_code).upper().strip()
-        score = zoning_config.get("default_score", 40)
-        matched = False
+        Args:
+            row: Parcel values, positioned per col_idx.
+            col_idx: Column name -> position in row.
 
-        # Define zone category checks in priority order
-        zone_categories = [
-            ("high_value", "codes", "industrial (score 100)"),
-            ("medium_high", "codes", "heavy commercial (score 75)"),
-            ("moderate", "codes", "highway commercial (score 65)"),
-            ("medium", "codes", "agricultural/general commercial (score 55)"),
-            ("pud", "codes", "planned development (score 50)"),
-            ("low_medium", "codes", "office/community commercial (score 40)"),
-        ]
+        Returns:
+            Tuple of (score, notes list).
+        """
+        zoning_code = self._get_value(row, col_idx, *ZONING_CODE_COLUMNS)
+        zoning_desc = self._get_value(row, col_idx, *ZONING_DESC_COLUMNS)
+        return self._score_zoning_values(zoning_code, zoning_desc)
 
-        # Check code-based categories
-        for category, list_type, description in zone_categories:
-            if matched:
-                break
-            category_config = zoning_config.get(category, {})
-            for code in category_config.get(list_type, []):
-                if code.upper() == zoning_code_upper or zoning_code_upper.startswith(code.upper()):
-                    score = category_config.get("score", 40)
-                    notes.append(f"Zoning: {zoning_code} ({description})")
-                    matched = True
-                    break
+    def _score_zoning_values(
+        self, zoning_code: Any, zoning_desc: Any
+    ) -> tuple[float, list[str]]:
+        """
+        Score a zoning code and description.
 
-        # Check pattern-based categories (low value and city placeholders)
-        if not matched:
-            low_value = zoning_config.get("low_value", {})
-            for pattern in low_value.get("patterns", []):
-                if zoning_code_upper.startswith(pattern.upper()) or pattern.upper() == zoning_code_upper:
-                    score = low_value.get("score", 10)
-                    notes.append(f"Zoning: {zoning_code} (residential/low-value, score 10)")
-                    matched = True
-                    break
+        Args:
+            zoning_code: Zoning code, or None if missing.
+            zoning_desc: Zoning description, or None if missing.
 
-        # Check city placeholder patterns
-        if not matched:
-            city_placeholders = zoning_config.get("city_placeholders", {})
-            for pattern in city_placeholders.get("patterns", []):
-                if pattern.upper() in zoning_code_upper or zoning_code_upper == pattern.upper():
-                    score = city_placeholders.get("score", 40)
-                    notes.append(f"Zoning: {zoning_code} (city jurisdiction, score 40)")
-                    matched = True
-                    break
+        Returns:
+            Tuple of (score, notes list).
+        """
+        notes = []
 
-        if not matched:
-            notes.append(f"Zoning: {zoning_code} (unrecognized, default score {score})")
+        if zoning_code is None:
+            notes.append("No zoning data available")
+            return self._zoning_default_score, notes
+
+        zoning_code_upper = str(zoning_code).upper().strip()
+        score = self._zoning_default_score
+
+        # Every configured code that is a prefix of (or equal to) this one,
+        # keeping the highest-priority match
+        best = None
+        for end in range(len(zoning_code_upper) + 1):
+            match = self._zoning_prefixes.get(zoning_code_upper[:end])
+            if match is not None and (best is None or match[0] < best[0]):
+                best = match
+
+        if best is not None:
+            _, score, description = best
+            notes.append(f"Zoning: {zoning_code} ({description})")
+        else:
+            # Check city placeholder patterns
+            placeholder_score, placeholder_patterns = self._zoning_placeholders
+            if any(pattern in zoning_code_upper for pattern in placeholder_patterns):
+                score = placeholder_score
+                notes.append(f"Zoning: {zoning_code} (city jurisdiction, score 40)")
+            else:
+                notes.append(f"Zoning: {zoning_code} (unrecognized, default score {score})")
 
         # Check for bonus keywords in description
-        if zoning_desc:
+        if zoning_desc and self._zoning_bonus_re is not None:
             zoning_desc_lower = str(zoning_desc).lower()
-            bonus_keywords = zoning_config.get("bonus_keywords", [])
+            if self._zoning_bonus_re.search(zoning_desc_lower):
+                for pattern, bonus in self._zoning_bonus:
+                    if pattern in zoning_desc_lower:
+                        score = min(100, score + bonus)
+                        notes.append(f"Zoning keyword bonus: '{pattern}' (+{bonus})")
 
-            for kw in bonus_keywords:
-                pattern = kw.get("pattern", "").lower()
-                bonus = kw.get("bonus", 0)
+        return score, notes
 
-                if pattern and pattern in zoning_desc_lower:
-                    score = min(100, score + bonus)
-                    notes.append(f"Zoning keyword bonus: '{pattern}' (+{bonus})")
+    def _score_land_use_vectorized(
+        self, gdf: pd.DataFrame, with_notes: bool = True
+    ) -> tuple[np.ndarray, Optional[list[list[str]]]]:
+        """
+        Score land use for every row at once.
 
-        return score, notes
+        Rows are grouped by their combination of land use text values; the
+        combined text is built and scored once per distinct combination with
+        the same rules as _score_land_use.
+
+        Args:
+            gdf: Parcels being scored.
+            with_notes: Whether to build the notes; skipped when not needed.
 
-    def _score_land_use(self, row: pd.Series) -> tuple[float, list[str]]:
+        Returns:
+            Tuple of (score array, notes list per row or None).
+        """
+        group_keys = np.zeros(len(gdf), dtype=np.int64)
+        column_codes = []
+        column_texts = []
+        for col in LAND_USE_TEXT_COLUMNS:
+            if col not in gdf.columns:
+                continue
+            codes, uniques = pd.factorize(gdf[col])
+            column_codes.append(codes)
+            column_texts.append([str(val).lower() if val else None for val in uniques])
+            group_keys, _ = pd.factorize(group_keys * (len(uniques) + 1) + codes + 1)
+
+        _, first = np.unique(group_keys, return_index=True)
+        results = []
+        for i in first:
+            text_fields = []
+            for codes, texts in zip(column_codes, column_texts):
+                if codes[i] >= 0 and texts[codes[i]] is not None:
+                    text_fields.append(texts[codes[i]])
+            results.append(self._score_land_use_text(" ".join(text_fields)))
+
+        scores = np.array([score for score, _ in results])[group_keys]
+        if not with_notes:
+            return scores, None
+        return scores, [results[k][1] for k in group_keys]
+
+    def _score_land_use(
+        self, row: tuple, col_idx: dict[str, int]
+    ) -> tuple[float, list[str]]:
         """
         Score based on current land use and property type.
 
         Args:
-            row: DataFrame row with parcel data.
+            row: Parcel values, positioned per col_idx.
+            col_idx: Column name -> position in row.
 
         Returns:
             Tuple of (score, notes list).
         """
-        notes = []
-        land_use_config = self.config.get("land_use", {})
-        default_score = land_use_config.get("default_score", 50)
-
         # Gather text fields to search
         text_fields = []
-
-        for field in [
-            "land_use",
-            "land_use_desc",
-            "property_type",
-            "building_description",
-            "occupancy_description",
-            "use_code",
-            "use_desc",
-            "proptype",
-            "bltasdesc",
-        ]:
-            val = self._get_value(row, field)
+        for col in LAND_USE_TEXT_COLUMNS:
+            val = self._get_value(row, col_idx, col)
             if val:
                 text_fields.append(str(val).lower())
 
-        combined_text = " ".join(text_fields)
+        return self._score_land_use_text(" ".join(text_fields))
+
+    def _score_land_use_text(self, combined_text: str) -> tuple[float, list[str]]:
+        """
+        Score land use keywords found in the joined, lowercased text fields.
+
+        Args:
+            combined_text: Land use text fields joined with spaces.
+
+        Returns:
+            Tuple of (score, notes list).
+        """
+        notes = []
+        default_score = self._land_use_default_score
 
         if not combined_text.strip():
             notes.append("No land use/property type data")
@@ -388,37 +799,27 @@ class IOSScorer:
         score = default_score
         matched_keyword = None
 
-        # Check high value keywords
-        high_value_keywords = land_use_config.get("high_value_keywords", [])
-        for kw in high_value_keywords:
-            pattern = kw.get("pattern", "").lower()
-            if pattern and pattern in combined_text:
-                kw_score = kw.get("score", 100)
-                if kw_score > score:
+        # Check high value keywords, then moderate keywords only if no high
+        # value match; each tier is sorted best-first so the first hit wins
+        for tier in ("high_value_keywords", "moderate_keywords"):
+            if matched_keyword is not None:
+                break
+            for pattern, kw_score in self._land_use_tiers[tier]:
+                if kw_score <= score:
+                    break
+                if pattern in combined_text:
                     score = kw_score
                     matched_keyword = pattern
+                    break
 
-        # Check moderate keywords (only if no high value match)
-        if matched_keyword is None:
-            moderate_keywords = land_use_config.get("moderate_keywords", [])
-            for kw in moderate_keywords:
-                pattern = kw.get("pattern", "").lower()
-                if pattern and pattern in combined_text:
-                    kw_score = kw.get("score", 60)
-                    if kw_score > score:
-                        score = kw_score
-                        matched_keyword = pattern
-
-        # Check property type patterns
-        property_types = land_use_config.get("property_types", [])
-        for pt in property_types:
-            pattern = pt.get("pattern", "").lower()
-            if pattern and pattern in combined_text:
-                pt_score = pt.get("score", 50)
-                # Use higher of keyword match and property type
-                if pt_score > score:
-                    score = pt_score
-                    matched_keyword = f"property type: {pattern}"
+        # Check property type patterns; use higher of keyword match and property type
+        for pattern, pt_score in self._land_use_tiers["property_types"]:
+            if pt_score <= score:
+                break
+            if pattern in combined_text:
+                score = pt_score
+                matched_keyword = f"property type: {pattern}"
+                break
 
         if matched_keyword:
             notes.append(f"Land use match: '{matched_keyword}'")
@@ -427,23 +828,87 @@ class IOSScorer:
 
         return score, notes
 
-    def _score_structural(self, row: pd.Series) -> tuple[float, list[str]]:
+    def _score_structural_vectorized(
+        self, gdf: pd.DataFrame, with_notes: bool = True
+    ) -> tuple[np.ndarray, Optional[list[list[str]]]]:
+        """
+        Score building count and size for every row at once.
+
+        Same rules as _score_structural, applied to whole columns.
+
+        Args:
+            gdf: Parcels being scored.
+            with_notes: Whether to build the notes; skipped when not needed.
+
+        Returns:
+            Tuple of (score array, notes list per row or None).
+        """
+        building_count = self._first_available(
+            gdf, "building_footprint_count", "improvement_count", "num_buildings"
+        )
+        building_count = np.trunc(np.nan_to_num(building_count, nan=0)).astype(int)
+
+        largest_building = self._first_available(
+            gdf, "total_building_sqft", "building_sqft", "building_footprint_sqft"
+        )
+        largest_building = np.nan_to_num(largest_building, nan=0)
+
+        count_thresholds = self._building_count_thresholds
+        count_idx = self._first_threshold_index(building_count, count_thresholds)
+        count_adjustments = np.array([t[1] for t in count_thresholds] + [0])
+        count_labels = [t[2] for t in count_thresholds] + [""]
+
+        size_thresholds = self._building_size_thresholds
+        size_idx = self._first_threshold_index(largest_building, size_thresholds)
+        size_adjustments = np.array([t[1] for t in size_thresholds] + [0])
+        size_labels = [t[2] for t in size_thresholds] + [""]
+
+        count_adjustment = count_adjustments[count_idx]
+        size_adjustment = size_adjustments[size_idx]
+        scores = np.clip(
+            self._structural_base_score + count_adjustment + size_adjustment, 0, 100
+        )
+        if not with_notes:
+            return scores, None
+
+        notes = []
+        for count, ci, c_adj, largest, si, s_adj in zip(
+            building_count.tolist(),
+            count_idx.tolist(),
+            count_adjustment.tolist(),
+            largest_building.tolist(),
+            size_idx.tolist(),
+            size_adjustment.tolist(),
+        ):
+            row_notes = [f"Buildings: {count} ({count_labels[ci]}, {c_adj:+d})"]
+            if largest > 0:
+                row_notes.append(
+                    f"Largest building: {largest:,.0f} sqft ({size_labels[si]}, {s_adj:+d})"
+                )
+            else:
+                row_notes.append("No building footprint data")
+            notes.append(row_notes)
+        return scores, notes
+
+    def _score_structural(
+        self, row: tuple, col_idx: dict[str, int]
+    ) -> tuple[float, list[str]]:
         """
         Score based on building count and sizes.
 
         Args:
-            row: DataFrame row with parcel data.
+            row: Parcel values, positioned per col_idx.
+            col_idx: Column name -> position in row.
 
         Returns:
             Tuple of (score, notes list).
         """
         notes = []
-        structural_config = self.config.get("structural", {})
-        base_score = structural_config.get("base_score", 50)
 
         # Get building count
         building_count = self._get_value(
             row,
+            col_idx,
             "building_footprint_count",
             "improvement_count",
             "num_buildings",
@@ -457,6 +922,7 @@ class IOSScorer:
         # Get largest building size
         largest_building = self._get_value(
             row,
+            col_idx,
             "total_building_sqft",
             "building_sqft",
             "building_footprint_sqft",
@@ -470,29 +936,25 @@ class IOSScorer:
         # Calculate building count adjustment
         count_adjustment = 0
         count_label = ""
-        count_thresholds = structural_config.get("building_count", [])
 
-        for threshold in count_thresholds:
-            count_val = threshold.get("count")
+        for count_val, adjustment, label in self._building_count_thresholds:
             if count_val is None or building_count <= count_val:
-                count_adjustment = threshold.get("adjustment", 0)
-                count_label = threshold.get("label", "")
+                count_adjustment = adjustment
+                count_label = label
                 break
 
         # Calculate building size adjustment
         size_adjustment = 0
         size_label = ""
-        size_thresholds = structural_config.get("building_size", [])
 
-        for threshold in size_thresholds:
-            max_val = threshold.get("max")
+        for max_val, adjustment, label in self._building_size_thresholds:
             if max_val is None or largest_building <= max_val:
-                size_adjustment = threshold.get("adjustment", 0)
-                size_label = threshold.get("label", "")
+                size_adjustment = adjustment
+                size_label = label
                 break
 
         # Calculate final score
-        score = base_score + count_adjustment + size_adjustment
+        score = self._structural_base_score + count_adjustment + size_adjustment
         score = max(0, min(100, score))  # Clamp to 0-100
 
         notes.append(f"Buildings: {building_count} ({count_label}, {count_adjustment:+d})")
@@ -504,18 +966,40 @@ class IOSScorer:
 
         return score, notes
 
-    def _score_location(self, row: pd.Series) -> tuple[float, list[str]]:
+    def _score_location_vectorized(
+        self, gdf: pd.DataFrame, with_notes: bool = True
+    ) -> tuple[np.ndarray, Optional[list[list[str]]]]:
+        """
+        Score location for every row at once.
+
+        Location scoring does not read any parcel values yet, so a single
+        score is computed and broadcast to every row.
+
+        Args:
+            gdf: Parcels being scored.
+            with_notes: Whether to build the notes; skipped when not needed.
+
+        Returns:
+            Tuple of (score array, notes list per row or None).
+        """
+        score, notes = self._score_location((), {})
+        return np.full(len(gdf), score), [notes] * len(gdf) if with_notes else None
+
+    def _score_location(
+        self, row: tuple, col_idx: dict[str, int]
+    ) -> tuple[float, list[str]]:
         """
         Score based on location factors.
 
         Args:
-            row: DataFrame row with parcel data.
+            row: Parcel values, positioned per col_idx.
+            col_idx: Column name -> position in row.
 
         Returns:
             Tuple of (score, notes list).
         """
         notes = []
-        location_config = self.config.get("location", {})
+        location_config = self._location_config
 
         # Start with base score for being in target area
         score = location_config.get("base_score", 60)
@@ -552,14 +1036,13 @@ class IOSScorer:
         Returns:
             Tuple of (grade letter, tier label).
         """
-        tiers = self.config.get("classification", {}).get("tiers", [])
-
-        for tier in tiers:
-            min_val = tier.get("min", 0)
-            max_val = tier.get("max", 100)
+        return self._classify_cached(score)
 
+    def _classify_uncached(self, score: float) -> tuple[str, str]:
+        """Scan the confidence tiers for a score; see classify_confidence."""
+        for min_val, max_val, grade, label in self._confidence_tiers:
             if min_val <= score <= max_val:
-                return tier.get("grade", "?"), tier.get("label", "Unknown")
+                return grade, label
 
         return "F", "Poor IOS Candidate"
 
@@ -609,28 +1092,42 @@ class IOSScorer:
         Args:
             row: DataFrame row containing parcel data.
 
+        Returns:
+            ScoreResult with composite and component scores.
+        """
+        col_idx = {name: i for i, name in enumerate(row.index)}
+        return self._score_row(tuple(row), col_idx)
+
+    def _score_row(self, row: tuple, col_idx: dict[str, int]) -> ScoreResult:
+        """
+        Score one parcel given as a tuple of values.
+
+        Args:
+            row: Parcel values, positioned per col_idx.
+            col_idx: Column name -> position in row.
+
         Returns:
             ScoreResult with composite and component scores.
         """
         all_notes = []
 
         # Calculate each dimension score
-        parcel_size_score, size_notes = self._score_parcel_size(row)
+        parcel_size_score, size_notes = self._score_parcel_size(row, col_idx)
         all_notes.extend(size_notes)
 
-        coverage_score, coverage_notes = self._score_building_coverage(row)
+        coverage_score, coverage_notes = self._score_building_coverage(row, col_idx)
         all_notes.extend(coverage_notes)
 
-        zoning_score, zoning_notes = self._score_zoning(row)
+        zoning_score, zoning_notes = self._score_zoning(row, col_idx)
         all_notes.extend(zoning_notes)
 
-        land_use_score, land_use_notes = self._score_land_use(row)
+        land_use_score, land_use_notes = self._score_land_use(row, col_idx)
         all_notes.extend(land_use_notes)
 
-        structural_score, structural_notes = self._score_structural(row)
+        structural_score, structural_notes = self._score_structural(row, col_idx)
         all_notes.extend(structural_notes)
 
-        location_score, location_notes = self._score_location(row)
+        location_score, location_notes = self._score_location(row, col_idx)
         all_notes.extend(location_notes)
 
         # Calculate weighted composite score
@@ -676,23 +1173,71 @@ class IOSScorer:
         """
         logger.info("Scoring %d parcels...", len(gdf))
 
-        # Score each parcel
-        results = []
-        for idx, row in gdf.iterrows():
-            result = self.score_parcel(row)
-            results.append(result.to_dict())
-
-        # Create results DataFrame
-        results_df = pd.DataFrame(results)
-
-        # Drop notes column if not requested
-        if not add_notes and "ios_notes" in results_df.columns:
-            results_df = results_df.drop(columns=["ios_notes"])
-
-        # Merge with original GeoDataFrame
-        scored_gdf = gdf.copy()
-        for col in results_df.columns:
-            scored_gdf[col] = results_df[col].values
+        # Dimensions that only need column arithmetic are scored in bulk;
+        # their notes are only built when the notes column is wanted
+        size_scores, size_notes = self._score_parcel_size_vectorized(gdf, add_notes)
+        coverage_scores, coverage_notes = self._score_building_coverage_vectorized(
+            gdf, add_notes
+        )
+        structural_scores, structural_notes = self._score_structural_vectorized(
+            gdf, add_notes
+        )
+        location_scores, location_notes = self._score_location_vectorized(gdf, add_notes)
+        zoning_scores, zoning_notes = self._score_zoning_vectorized(gdf, add_notes)
+
+        land_use_scores, land_use_notes = self._score_land_use_vectorized(gdf, add_notes)
+
+        # Weighted composite score as one matrix-vector product
+        components = np.column_stack(
+            [
+                size_scores,
+                coverage_scores,
+                zoning_scores,
+                land_use_scores,
+                structural_scores,
+                location_scores,
+            ]
+        ).astype(float)
+        composite = components @ self._weights_vec
+
+        # Classify each distinct composite score once
+        score_keys, unique_scores = pd.factorize(composite, use_na_sentinel=False)
+        tiers = [self.classify_confidence(score) for score in unique_scores]
+        grades = np.array([grade for grade, _ in tiers], dtype=object)[score_keys]
+        tier_labels = np.array([tier_label for _, tier_label in tiers], dtype=object)[score_keys]
+
+        # Create results DataFrame straight from the score columns
+        results_df = pd.DataFrame(
+            {
+                "ios_score": composite,
+                "ios_grade": grades,
+                "ios_tier": tier_labels,
+                "score_parcel_size": size_scores,
+                "score_building_coverage": coverage_scores,
+                "score_zoning": zoning_scores,
+                "score_land_use": land_use_scores,
+                "score_structural": structural_scores,
+                "score_location": location_scores,
+            }
+        )
+        if add_notes:
+            results_df["ios_notes"] = [
+                "; ".join(a + b + c + d + e + f)
+                for a, b, c, d, e, f in zip(
+                    size_notes,
+                    coverage_notes,
+                    zoning_notes,
+                    land_use_notes,
+                    structural_notes,
+                    location_notes,
+                )
+            ]
+
+        # Merge with original GeoDataFrame in one concat; score columns from
+        # an earlier scoring run are replaced
+        results_df.index = gdf.index
+        stale = [col for col in results_df.columns if col in gdf.columns]
+        scored_gdf = pd.concat([gdf.drop(columns=stale), results_df], axis=1)
 
         # Sort by IOS score descending
         scored_gdf = scored_gdf.sort_values("ios_score", ascending=False)